@@ -0,0 +1,24 @@
+"""Helpers shared by the build_*.py scripts."""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+# Heavy packages the stdlib-only tools never import. Excluding them keeps
+# PyInstaller's analysis from walking them if they are installed in the venv.
+EXCLUDES = [
+    "tkinter", "numpy", "pandas", "matplotlib", "PyQt5", "PyQt6",
+    "PySide2", "PySide6", "IPython", "pytest", "setuptools",
+    "distutils", "lib2to3", "test", "unittest",
+]
+
+
+@lru_cache(maxsize=4096)
+def exists_cached(p: str) -> bool:
+    """Path existence check memoized for the lifetime of the build process.
+
+    Only use this for inputs that do not change during a build (source
+    scripts, pre-existing bundles). Build outputs must be checked with a
+    fresh ``os.path.exists()`` since they appear mid-run.
+    """
+    return os.path.exists(p)
@@ -0,0 +1,332 @@
+"""Build the standalone tool EXEs from one declarative spec.
+
+Every tool is described by an entry in TARGETS; build_one() turns an entry
+into PyInstaller arguments and runs PyInstaller in-process. The per-tool
+build_*.py scripts are thin shims around build_one().
+
+Running this script builds all tools (or the ones named on the command line)
+in parallel with a ProcessPoolExecutor. Each target builds into its own
+staging folder under dist/.staging/<name>/ and each worker process has its
+own PyInstaller cache, so concurrent builds never write into the same
+directories; finished EXEs
+are then moved into dist/. Pass --full to force clean (non-cached) builds;
+set BUILD_QUIET=1 to hide PyInstaller's INFO output.
+
+With --mode=dir a single one-directory bundle is built instead: dist/toolbox/
+holds one shared Python runtime plus a .cmd entry stub per tool.
+"""
+from __future__ import annotations
+
+import atexit
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from _build_common import EXCLUDES, exists_cached
+
+DIST_DIR = "dist"
+BUILD_DIR = "build"
+STAGING_DIR = "dist/.staging"
+
+# Tool modules the launcher imports and dispatches to (see TOOLS in
+# scripts/toolbox_launcher.py)
+TOOL_MODULES = [
+    "scripts.nef_to_jpg",
+    "scripts.organize_photos",
+    "scripts.video_compressor",
+    "scripts.find_duplicates",
+    "scripts.battery_report",
+    "scripts.sort_by_extension",
+    "scripts.sort_by_type",
+    "scripts.example_tool",
+]
+
+# Declarative build spec. Optional keys:
+# - console: False builds a windowed (GUI) EXE
+# - hidden_imports: modules PyInstaller cannot discover on its own
+# - exclude_modules: modules PyInstaller should not analyze or bundle
+# - extra_args: additional PyInstaller arguments
+# - onedir: build a one-directory bundle (dist/<name>/) instead of --onefile
+# - stubs: tool names to write <tool>.cmd entry stubs for inside the bundle
+# - prepare: "module:function" returning extra PyInstaller arguments computed
+#   at build time, or None if the target cannot be built
+# - usage: lines printed after a successful build
+TARGETS = [
+    {
+        "name": "battery_report",
+        "script": "scripts/battery_report.py",
+        "exclude_modules": EXCLUDES,
+        "usage": [
+            "1. Copy battery_report.exe to any folder",
+            "2. Right-click and 'Run as administrator' for full report",
+            "3. Or double-click for basic report",
+            "4. Report will be generated and opened in your browser",
+        ],
+    },
+    {
+        "name": "find_duplicates",
+        "script": "scripts/find_duplicates.py",
+        "exclude_modules": EXCLUDES,
+        "usage": [
+            "1. Copy find_duplicates.exe to any folder",
+            "2. Double-click the EXE to scan for duplicates",
+            "3. Choose whether to report only or move duplicates",
+        ],
+    },
+    {
+        "name": "js_dev_setup",
+        "script": "scripts/js_dev_setup.py",
+        "exclude_modules": EXCLUDES,
+        "usage": [
+            "1. Copy js_dev_setup.exe to any Windows PC",
+            "2. Right-click and 'Run as administrator' (REQUIRED)",
+            "3. The tool will install NVM, Node.js, Git, VS Code, Chrome, and Windows Terminal",
+            "4. VS Code will be configured with recommended settings",
+            "IMPORTANT: Administrator privileges are required for software installation!",
+        ],
+    },
+    {
+        "name": "nef_to_jpg",
+        "script": "scripts/nef_to_jpg.py",
+        "usage": [
+            "1. Copy nef_to_jpg.exe to any folder",
+            "2. Double-click the EXE to batch convert NEF images to JPG",
+            "3. Use command-line flags for advanced options (see README)",
+        ],
+    },
+    {
+        "name": "sort_by_extension",
+        "script": "scripts/sort_by_extension.py",
+        "exclude_modules": EXCLUDES,
+        "usage": [
+            "1. Copy sort_by_extension.exe to any folder",
+            "2. Double-click the EXE to sort files by extension",
+            "3. Files will be organized into 'sorted_files/' subfolders",
+            "4. Original files are preserved in their current locations",
+        ],
+    },
+    {
+        "name": "sort_by_type",
+        "script": "scripts/sort_by_type.py",
+        "exclude_modules": EXCLUDES,
+        "usage": [
+            "The EXE can be dropped into any folder to sort files by type.",
+            "It will create a 'sorted_by_type' subfolder with organized file categories.",
+        ],
+    },
+    {
+        "name": "toolbox_launcher",
+        "script": "scripts/toolbox_launcher.py",
+        "console": False,
+        "hidden_imports": TOOL_MODULES,
+        "usage": ["Run it: .\\dist\\toolbox_launcher.exe"],
+    },
+    {
+        "name": "video_compressor",
+        "script": "scripts/video_compressor.py",
+        "extra_args": ["--strip", "--icon", "NONE", "--paths", "src"],
+        "prepare": "build_video_compressor:ffmpeg_pyinstaller_args",
+        "usage": ["This EXE includes FFmpeg and requires no separate installation."],
+    },
+]
+
+# --mode=dir: one shared runtime in dist/toolbox/ instead of one self-extracting
+# EXE per tool. Each tool gets a small .cmd stub that re-enters toolbox.exe
+# with --run-tool, so the Python runtime is stored (and unpacked) only once.
+TOOLBOX_TARGET = {
+    "name": "toolbox",
+    "script": "scripts/toolbox_launcher.py",
+    "onedir": True,
+    "hidden_imports": TOOL_MODULES,
+    "stubs": [m.split(".", 1)[1] for m in TOOL_MODULES],
+    "usage": [
+        "Add dist\\toolbox to PATH, then run e.g. 'nef_to_jpg' in any folder.",
+        "Run toolbox.exe without arguments to open the launcher GUI.",
+    ],
+}
+
+TARGETS_BY_NAME = {t["name"]: t for t in TARGETS + [TOOLBOX_TARGET]}
+
+# One worker pool for the lifetime of the driver; spawning workers is slow on Windows
+_EXECUTOR = None
+# Its size: more workers than targets would never get a build
+BUILD_WORKERS = min(len(TARGETS), os.cpu_count() or 1)
+
+
+def _init_build_worker() -> None:
+    """Pool initializer: give this worker process its own PyInstaller cache.
+
+    PyInstaller reads PYINSTALLER_CONFIG_DIR once, when it is first imported,
+    and a worker builds several targets with it, so the cache belongs to
+    the worker rather than to a target.
+    """
+    os.environ["PYINSTALLER_CONFIG_DIR"] = os.path.join(tempfile.gettempdir(), f"pyi-worker-{os.getpid()}")
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=BUILD_WORKERS,
+                                        initializer=_init_build_worker)
+        atexit.register(_EXECUTOR.shutdown)
+    return _EXECUTOR
+
+
+def exe_filename(name: str) -> str:
+    return f"{name}.exe" if os.name == "nt" else name
+
+
+def build_args(target: dict, dist_dir: str = DIST_DIR, full: bool = False) -> list[str]:
+    """Translate a TARGETS entry into PyInstaller command-line arguments."""
+    args = [
+        "--onedir" if target.get("onedir") else "--onefile",
+        "--console" if target.get("console", True) else "--windowed",
+        "--noconfirm",
+        f"--name={target['name']}",
+        f"--distpath={dist_dir}",
+        f"--workpath={BUILD_DIR}",
+        # Spec at the project root keeps relative --paths/--add-binary valid
+        "--specpath=.",
+    ]
+    if full:
+        # Wipe PyInstaller's cached analysis for a completely fresh build
+        args.append("--clean")
+    if os.environ.get("BUILD_QUIET"):
+        # PyInstaller logs straight to the console; only show warnings and errors
+        args.append("--log-level=WARN")
+    args += [f"--hidden-import={module}" for module in target.get("hidden_imports", [])]
+    args += [f"--exclude-module={module}" for module in target.get("exclude_modules", [])]
+    args += target.get("extra_args", [])
+    args.append(target["script"])
+    return args
+
+
+def build_one(name: str, dist_dir: str = DIST_DIR, full: bool = False) -> bool:
+    """Build a single target with PyInstaller running in this process."""
+    target = TARGETS_BY_NAME[name]
+    script = target["script"]
+    if not exists_cached(script):
+        print(f"❌ Error: {script} not found")
+        return False
+
+    args = build_args(target, dist_dir, full)
+    if target.get("prepare"):
+        module_name, func_name = target["prepare"].split(":")
+        extra = getattr(importlib.import_module(module_name), func_name)()
+        if extra is None:
+            print(f"❌ {name}: preparation failed. Aborting.")
+            return False
+        args[-1:-1] = extra
+
+    print(f"🔨 Building {exe_filename(name)} from {script}...")
+
+    # When a build_*.py shim calls this directly, use a cache of the target's own
+    # (pool workers already have one per worker; see _init_build_worker).
+    # PyInstaller reads this once at import time, so it must be set first.
+    os.environ.setdefault("PYINSTALLER_CONFIG_DIR", os.path.join(tempfile.gettempdir(), f"pyi-{name}"))
+    try:
+        from PyInstaller import __main__ as pyi
+    except ImportError:
+        print("❌ Error: PyInstaller not found. Install with: pip install pyinstaller")
+        return False
+
+    try:
+        pyi.run(args)
+    except SystemExit as e:
+        # PyInstaller reports fatal build errors by raising SystemExit
+        print(f"❌ {name}: build failed: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ {name}: build failed: {e}")
+        return False
+
+    bundle_dir = os.path.join(dist_dir, name) if target.get("onedir") else dist_dir
+    exe_path = os.path.join(bundle_dir, exe_filename(name))
+    if not os.path.exists(exe_path):
+        print(f"❌ {name}: build finished but EXE not found.")
+        return False
+
+    size_mb = os.path.getsize(exe_path) / (1024 * 1024)
+    print(f"✅ Build successful -> {exe_path} ({size_mb:.1f} MB)")
+    for tool in target.get("stubs", []):
+        _write_stub(bundle_dir, exe_filename(name), tool)
+    for line in target.get("usage", []):
+        print(f"   {line}")
+    return True
+
+
+def _write_stub(bundle_dir: str, exe_name: str, tool: str) -> None:
+    """Write a <tool>.cmd entry stub that runs the tool through the shared EXE."""
+    stub_path = os.path.join(bundle_dir, f"{tool}.cmd")
+    with open(stub_path, "w", encoding="utf-8", newline="") as f:
+        f.write(f'@"%~dp0{exe_name}" --run-tool {tool} %*\r\n')
+
+
+def _build_staged(name: str, full: bool) -> bool:
+    """Worker entry point: build one target into its staging folder."""
+    return build_one(name, dist_dir=str(Path(STAGING_DIR) / name), full=full)
+
+
+def _collect(name: str) -> None:
+    """Move a target's finished artifacts from staging into dist/."""
+    staging = Path(STAGING_DIR) / name
+    if not staging.exists():
+        return
+    for item in staging.iterdir():
+        dest = Path(DIST_DIR) / item.name
+        if dest.is_dir():
+            shutil.rmtree(dest)
+        elif dest.exists():
+            dest.unlink()
+        shutil.move(str(item), str(dest))
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    full = "--full" in argv
+    if "--mode=dir" in argv:
+        return 0 if build_one(TOOLBOX_TARGET["name"], full=full) else 1
+    names = [a for a in argv if not a.startswith("--")] or [t["name"] for t in TARGETS]
+    unknown = [n for n in names if n not in TARGETS_BY_NAME]
+    if unknown:
+        print(f"❌ Unknown target(s): {', '.join(unknown)}")
+        print(f"   Available: {', '.join(TARGETS_BY_NAME)}")
+        return 1
+
+    Path(DIST_DIR).mkdir(exist_ok=True)
+    pool = _get_executor()
+    # The pool is sized for TARGETS; the toolbox build can make names one longer
+    workers = min(len(names), BUILD_WORKERS)
+    print(f"🔨 Building {len(names)} tool(s) with {workers} worker(s)...")
+
+    results = {}
+    futures = {pool.submit(_build_staged, name, full): name for name in names}
+    for future in as_completed(futures):
+        name = futures[future]
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            print(f"❌ {name}: builder crashed: {e}")
+            results[name] = False
+        else:
+            print(f"{'✅' if results[name] else '❌'} {name}")
+
+    for name, ok in results.items():
+        if ok:
+            _collect(name)
+
+    failed = [name for name, ok in results.items() if not ok]
+    print(f"\n📦 Built {len(names) - len(failed)}/{len(names)} tool(s) into {DIST_DIR}/")
+    if failed:
+        print(f"❌ Failed: {', '.join(sorted(failed))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,58 +3,161 @@ FFmpeg Downloader and Bundler for PyInstaller
 
 This script downloads FFmpeg binaries for Windows and sets up PyInstaller
 to bundle them with the video compressor executable.
+The build itself is defined in the TARGETS spec in build_all.py.
 """
 
+import hashlib
+import json
 import os
 import sys
 import urllib.request
 import zipfile
 from pathlib import Path
 import shutil
-import subprocess
+
+from _build_common import exists_cached
+from build_all import build_one
+
+
+# FFmpeg release URL (Windows essentials build)
+# Using a reliable third-party build since official releases are large
+FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+# gyan.dev publishes each build's SHA-256 next to it
+FFMPEG_SHA256_URL = FFMPEG_URL + ".sha256"
+
+# Sidecar recording which download the local bundle came from
+FFMPEG_CACHE_FILE = "ffmpeg_cache.json"
+
+
+def _remote_fingerprint(url: str) -> dict:
+    """Return ETag/Content-Length for the URL, or {} if the server can't be reached."""
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=15) as resp:
+            return {
+                "etag": resp.headers.get("ETag"),
+                "content_length": resp.headers.get("Content-Length"),
+            }
+    except Exception:
+        return {}
+
+
+def _published_sha256(url: str):
+    """Return the SHA-256 published for the download, or None if it can't be fetched."""
+    try:
+        with urllib.request.urlopen(url, timeout=15) as resp:
+            text = resp.read(4096).decode("ascii", "replace").split()
+        return text[0].lower() if text else None
+    except Exception:
+        return None
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cache(ffmpeg_dir: Path) -> dict:
+    try:
+        return json.loads((ffmpeg_dir / FFMPEG_CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _find_extracted_ffmpeg(ffmpeg_dir: Path):
+    """Locate bin/ffmpeg.exe inside a previously extracted release folder."""
+    for folder in ffmpeg_dir.iterdir():
+        candidate = folder / "bin" / "ffmpeg.exe"
+        if folder.is_dir() and candidate.exists():
+            return candidate
+    return None
 
 
 def download_ffmpeg_windows():
-    """Download FFmpeg binaries for Windows."""
+    """Download FFmpeg binaries for Windows.
+
+    The download is skipped when the local copy matches the remote release
+    (same ETag/Content-Length as recorded in ffmpeg_cache.json), or when the
+    server is unreachable and a previously extracted copy is available; either
+    way the cached ffmpeg.exe must still match its recorded SHA-256. A fresh
+    download is checked against the published SHA-256 before extraction.
+    """
     ffmpeg_dir = Path("ffmpeg_bundle")
     ffmpeg_dir.mkdir(exist_ok=True)
+    bundle_ffmpeg = ffmpeg_dir / "ffmpeg.exe"
     
-    # FFmpeg release URL (Windows essentials build)
-    # Using a reliable third-party build since official releases are large
-    ffmpeg_url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+    cache = _load_cache(ffmpeg_dir)
+    exe_sha256 = cache.get("exe_sha256")
+    if exe_sha256:
+        remote = _remote_fingerprint(FFMPEG_URL)
+        if not remote or all(remote.get(k) == cache.get(k) for k in ("etag", "content_length")):
+            if bundle_ffmpeg.exists() and _file_sha256(bundle_ffmpeg) == exe_sha256:
+                print(f"FFmpeg is up to date (cached): {bundle_ffmpeg}")
+                return bundle_ffmpeg
+            extracted = _find_extracted_ffmpeg(ffmpeg_dir)
+            if extracted and _file_sha256(extracted) == exe_sha256:
+                shutil.copy2(extracted, bundle_ffmpeg)
+                print(f"FFmpeg restored from local cache: {bundle_ffmpeg}")
+                return bundle_ffmpeg
+            print("Cached FFmpeg doesn't match its recorded SHA-256; downloading again")
     
     print("Downloading FFmpeg (this may take a few minutes)...")
     zip_path = ffmpeg_dir / "ffmpeg.zip"
     
     try:
-        urllib.request.urlretrieve(ffmpeg_url, zip_path)
+        # Stream to disk in 1 MiB chunks, hashing as we go
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(FFMPEG_URL) as resp, open(zip_path, "wb") as out:
+            fingerprint = {
+                "etag": resp.headers.get("ETag"),
+                "content_length": resp.headers.get("Content-Length"),
+            }
+            for chunk in iter(lambda: resp.read(1024 * 1024), b""):
+                digest.update(chunk)
+                out.write(chunk)
+        zip_sha256 = digest.hexdigest()
+        
+        expected = _published_sha256(FFMPEG_SHA256_URL)
+        if expected is None:
+            print("Warning: couldn't fetch the published SHA-256; the download is not verified")
+        elif expected != zip_sha256:
+            zip_path.unlink()
+            print(f"Error: FFmpeg download is corrupt (SHA-256 {zip_sha256}, expected {expected})")
+            return None
         print("Download complete. Extracting...")
         
+        # Drop extracted trees from older releases before unpacking the new one
+        for folder in ffmpeg_dir.iterdir():
+            if folder.is_dir():
+                shutil.rmtree(folder)
+        
+        # Only bin/ffmpeg.exe is bundled; skip ffprobe, docs and presets
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(ffmpeg_dir)
+            for member in zip_ref.infolist():
+                if member.filename.endswith("/bin/ffmpeg.exe"):
+                    zip_ref.extract(member, ffmpeg_dir)
         
         # Find the extracted folder (usually has version number)
-        extracted_folders = [f for f in ffmpeg_dir.iterdir() if f.is_dir()]
-        if extracted_folders:
-            ffmpeg_folder = extracted_folders[0]
-            ffmpeg_exe = ffmpeg_folder / "bin" / "ffmpeg.exe"
+        ffmpeg_exe = _find_extracted_ffmpeg(ffmpeg_dir)
+        if ffmpeg_exe:
+            # Copy to bundle directory
+            shutil.copy2(ffmpeg_exe, bundle_ffmpeg)
+            print(f"FFmpeg extracted to: {bundle_ffmpeg}")
             
-            if ffmpeg_exe.exists():
-                # Copy to bundle directory
-                bundle_ffmpeg = ffmpeg_dir / "ffmpeg.exe"
-                shutil.copy2(ffmpeg_exe, bundle_ffmpeg)
-                print(f"FFmpeg extracted to: {bundle_ffmpeg}")
-                
-                # Cleanup
-                zip_path.unlink()
-                shutil.rmtree(ffmpeg_folder)
-                
-                return bundle_ffmpeg
-            else:
-                print("Error: ffmpeg.exe not found in extracted files")
-                return None
+            # Keep the extracted tree so later builds can restore ffmpeg.exe
+            # without going back to the network; the zip itself is not needed.
+            zip_path.unlink()
+            (ffmpeg_dir / FFMPEG_CACHE_FILE).write_text(
+                json.dumps({"sha256": zip_sha256, "exe_sha256": _file_sha256(bundle_ffmpeg), **fingerprint}, indent=2),
+                encoding="utf-8",
+            )
+            
+            return bundle_ffmpeg
         else:
-            print("Error: No folders found in extracted zip")
+            print("Error: ffmpeg.exe not found in extracted files")
             return None
             
     except Exception as e:
@@ -62,47 +165,33 @@ def download_ffmpeg_windows():
         return None
 
 
-def build_video_compressor_with_ffmpeg():
-    """Build video compressor with bundled FFmpeg."""
+def ffmpeg_pyinstaller_args():
+    """Ensure FFmpeg is available locally and return the PyInstaller args bundling it."""
     # Download FFmpeg if not present
     ffmpeg_bundle_dir = Path("ffmpeg_bundle")
     ffmpeg_exe = ffmpeg_bundle_dir / "ffmpeg.exe"
     
-    if not ffmpeg_exe.exists():
+    if not exists_cached(str(ffmpeg_exe)):
         print("FFmpeg not found, downloading...")
         downloaded_ffmpeg = download_ffmpeg_windows()
         if not downloaded_ffmpeg:
-            print("Failed to download FFmpeg. Aborting.")
-            return False
+            print("Failed to download FFmpeg.")
+            return None
         ffmpeg_exe = downloaded_ffmpeg
     
-    # Build with PyInstaller, including FFmpeg
-    print("Building video compressor with bundled FFmpeg...")
-    
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",
-        "--console",
-        "--name", "video_compressor",
-        "--add-binary", f"{ffmpeg_exe};.",  # Bundle FFmpeg in root of exe
-        "--strip",
-        "--icon", "NONE",
-        "--paths", "src",
-        "scripts/video_compressor.py"
-    ]
-    
-    try:
-        result = subprocess.run(cmd, check=True)
-        print("Build successful! Check dist/video_compressor.exe")
-        print("This EXE now includes FFmpeg and requires no separate installation.")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Build failed: {e}")
-        return False
+    # Bundle FFmpeg in root of exe
+    return ["--add-binary", f"{ffmpeg_exe.resolve()}{os.pathsep}."]
+
+
+def build_video_compressor_with_ffmpeg(dist_dir: str = "dist", full: bool = False):
+    """Build video compressor with bundled FFmpeg."""
+    return build_one("video_compressor", dist_dir=dist_dir, full=full)
 
 
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "download-only":
         download_ffmpeg_windows()
     else:
-        build_video_compressor_with_ffmpeg()
+        success = build_video_compressor_with_ffmpeg(full="--full" in sys.argv)
+        if not success:
+            sys.exit(1)
@@ -27,6 +27,8 @@ from __future__ import annotations
 
 import sys
 import os
+import ctypes
+import mmap
 import subprocess
 import webbrowser
 from pathlib import Path
@@ -46,11 +48,9 @@ def get_base_dir() -> Path:
 def check_admin_privileges() -> bool:
     """Check if running with administrator privileges."""
     try:
-        # Try to access a system directory that requires admin rights
-        test_path = Path("C:\\Windows\\System32\\config")
-        list(test_path.iterdir())
-        return True
-    except (PermissionError, OSError):
+        # Query the process token directly; no filesystem access needed
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
         return False
 
 
@@ -60,11 +60,13 @@ def generate_battery_report(output_path: Path) -> bool:
         # Run powercfg to generate battery report
         cmd = ["powercfg", "/batteryreport", "/output", str(output_path)]
         
+        # CREATE_NO_WINDOW avoids allocating a throwaway console for the child
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
         )
         
         return output_path.exists()
@@ -84,10 +86,8 @@ def generate_battery_report(output_path: Path) -> bool:
 
 def enhance_html_report(report_path: Path) -> None:
     """Add some basic styling and additional information to the HTML report."""
+    tmp_path = report_path.with_name(report_path.name + ".tmp")
     try:
-        # Read the original report
-        content = report_path.read_text(encoding='utf-8')
-        
         # Add custom styling and header
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         enhanced_content = f"""
@@ -151,18 +151,7 @@ def enhance_html_report(report_path: Path) -> None:
     <div class="content">
 """
         
-        # Find where the original content starts (after any existing head/body tags)
-        if '<body>' in content:
-            original_body = content.split('<body>', 1)[1]
-            if '</body>' in original_body:
-                original_body = original_body.rsplit('</body>', 1)[0]
-        else:
-            # If no body tags, use the entire content
-            original_body = content
-        
-        # Add the original content and footer
-        enhanced_content += original_body
-        enhanced_content += """
+        footer = """
     </div>
     <div class="footer">
         <p>Report generated using Windows PowerCfg utility</p>
@@ -172,10 +161,35 @@ def enhance_html_report(report_path: Path) -> None:
 </html>
 """
         
-        # Write the enhanced content back
-        report_path.write_text(enhanced_content, encoding='utf-8')
+        # Map the original report instead of reading it into a string, locate the
+        # body content by byte offset and stream header + body + footer to a temp file
+        with open(report_path, 'rb') as src, \
+                mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                open(tmp_path, 'wb') as out:
+            # Find where the original content starts (after any existing head/body tags)
+            body_start = mm.find(b'<body>')
+            if body_start != -1:
+                body_start += len(b'<body>')
+                body_end = mm.rfind(b'</body>', body_start)
+                if body_end == -1:
+                    body_end = len(mm)
+            else:
+                # If no body tags, use the entire content
+                body_start, body_end = 0, len(mm)
+            
+            out.write(enhanced_content.encode('utf-8'))
+            out.write(mm[body_start:body_end])
+            out.write(footer.encode('utf-8'))
+        
+        # Swap the enhanced report in place of the original
+        os.replace(tmp_path, report_path)
         
     except Exception as e:
+        # Don't leave a half-written copy next to the report
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
         print(f"Warning: Could not enhance HTML report: {e}")
         # Continue anyway with the original report
 
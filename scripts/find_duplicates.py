@@ -3,7 +3,7 @@ Duplicate File Finder
 
 Behavior:
 - When run as a bundled EXE dropped into any folder, it scans that folder (and subfolders)
-  for duplicate files by comparing SHA-256 hashes, and optionally moves duplicates to a
+  for duplicate files by comparing content hashes, and optionally moves duplicates to a
   timestamped "Duplicates_YYYYMMDD" folder for manual review.
 - When run as a script via Python, it scans the current working directory.
 
@@ -14,27 +14,55 @@ Duplicates_20250910/
 └── ...
 
 Dependencies:
-- hashlib (built-in) for file hashing
+- blake3 (optional) for fast SIMD/multithreaded file hashing
+- hashlib (built-in) for SHA-256 file hashing when blake3 is unavailable or --sha256 is given
 - shutil (built-in) for file operations
+- sqlite3 (built-in) for the hash cache
 
 Notes:
 - If double-clicking the EXE, a prompt at the end will keep the console open.
-- Uses SHA-256 hash for reliable duplicate detection.
+- Uses BLAKE3 (if installed) or SHA-256 hashes for reliable duplicate detection.
 - Preserves one copy of each file in original location.
 - Shows file sizes and paths for easy identification.
 - Interactive mode asks before moving files.
+- Files smaller than --min-size bytes are ignored; empty files are reported as one
+  group without hashing.
+- Hashes are cached by (device, inode, size, mtime) so reruns only hash changed
+  files; pass --no-cache to disable.
 """
 
 from __future__ import annotations
 
 import sys
 import os
+import errno
 import shutil
+import time
 import hashlib
+import mmap
+import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set
-from collections import defaultdict
+from typing import AbstractSet, Dict, Iterator, List, Optional, Set, Tuple, Union
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    import blake3  # type: ignore
+except ImportError:
+    blake3 = None
+
+# Files at least this large are hashed straight from a memory mapping
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# (digest, size in bytes, paths); the first path is the copy that is kept
+DuplicateGroup = Tuple[bytes, int, List[Path]]
+
+# Persistent hash cache shared by all runs, wherever the EXE is dropped
+HASH_CACHE_PATH = Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache") / "find_duplicates" / "hashes.sqlite"
+
+# BLAKE3 is much faster than SHA-256 and collision resistance is all we need
+DEFAULT_ALGORITHM = "blake3" if blake3 is not None else "sha256"
 
 
 def is_frozen() -> bool:
@@ -46,93 +74,384 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
-def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
-    """Calculate SHA-256 hash of a file."""
+def _sha256_digest(f, chunk_size: int) -> bytes:
+    """SHA-256 digest of an open (unbuffered) file."""
     sha256_hash = hashlib.sha256()
+    if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+        # Hash the page cache directly, without copying into a buffer
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if hasattr(m, "madvise"):
+                m.madvise(mmap.MADV_SEQUENTIAL)
+            sha256_hash.update(m)
+        return sha256_hash.digest()
     
+    if sys.version_info >= (3, 11):
+        # Reads and hashes in C with the GIL released between chunks
+        return hashlib.file_digest(f, "sha256").digest()
+    
+    # Read into one reusable buffer; we do our own buffering
+    buf = bytearray(chunk_size)
+    mv = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        sha256_hash.update(mv[:n])
+    return sha256_hash.digest()
+
+
+def calculate_file_hash(file_path: Union[str, Path], chunk_size: int = 1 << 20, algorithm: str = DEFAULT_ALGORITHM) -> bytes:
+    """Calculate the BLAKE3 or SHA-256 digest (32 bytes) of a file."""
+    try:
+        if algorithm == "blake3":
+            # Memory-maps the file and hashes it with SIMD across all cores
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(str(file_path))
+            return hasher.digest()
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            # posix_fadvise is POSIX-only (not available on Windows)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            try:
+                return _sha256_digest(f, chunk_size)
+            finally:
+                if hasattr(os, "posix_fadvise"):
+                    # Each file is read once; don't evict the user's working set for it
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except (OSError, IOError, ValueError) as e:
+        print(f"Warning: Could not read {file_path}: {e}")
+        return b""
+
+
+def quick_fingerprint(file_path: Union[str, Path], n: int = 4096) -> bytes:
+    """Hash the first and last n bytes of a file; cheap pre-filter before the full hash."""
     try:
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+            data = f.read(n)
+            size = os.fstat(f.fileno()).st_size
+            if size > n:
+                f.seek(max(n, size - n))
+                data += f.read(n)
     except (OSError, IOError) as e:
         print(f"Warning: Could not read {file_path}: {e}")
-        return ""
+        return b""
+    
+    if blake3 is not None:
+        return blake3.blake3(data).digest()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 
+def bytes_to_mb(size: int) -> float:
+    """Convert a size in bytes to MB."""
+    return size / (1024 * 1024)
 
-def get_file_size_mb(path: Path) -> float:
-    """Get file size in MB."""
+
+def open_hash_cache(path: Path = HASH_CACHE_PATH) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the on-disk hash cache, or return None if unavailable."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "dev INT, ino INT, algorithm TEXT, size INT, mtime INT, hash BLOB, "
+            "PRIMARY KEY(dev, ino, algorithm))"
+        )
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Hash cache unavailable: {e}")
+        return None
+
+
+def cache_key(file_path: Union[str, Path]) -> Optional[tuple]:
+    """Return the (dev, ino, size, mtime_ns) cache key for a file, or None if it can't be cached."""
     try:
-        return path.stat().st_size / (1024 * 1024)
+        st = os.stat(file_path)
     except OSError:
-        return 0.0
+        return None
+    # Some filesystems report no inode number (or one too wide for SQLite)
+    if not st.st_ino or st.st_ino >= 1 << 63 or st.st_dev >= 1 << 63:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def lookup_cached_hash(conn: sqlite3.Connection, key: tuple, algorithm: str) -> bytes:
+    """Return the cached hash for a file if its size and mtime are unchanged, else b""."""
+    dev, ino, size, mtime = key
+    row = conn.execute(
+        "SELECT size, mtime, hash FROM hashes WHERE dev = ? AND ino = ? AND algorithm = ?",
+        (dev, ino, algorithm),
+    ).fetchone()
+    if row and row[0] == size and row[1] == mtime:
+        return row[2]
+    return b""
+
+
+def store_cached_hashes(conn: sqlite3.Connection, entries: List[tuple], algorithm: str) -> None:
+    """Insert (key, hash) pairs into the cache, 1000 rows per transaction."""
+    rows = [(*key, algorithm, file_hash) for key, file_hash in entries]
+    try:
+        for start in range(0, len(rows), 1000):
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO hashes (dev, ino, size, mtime, algorithm, hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows[start:start + 1000],
+                )
+    except sqlite3.Error as e:
+        print(f"Warning: Could not update hash cache: {e}")
+
+
+def iter_files(root_dir: Path, exclude_dirs: AbstractSet[str]) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file under root_dir, skipping excluded directories.
+
+    DirEntry objects carry the type and (on Windows) stat data returned by the
+    directory listing, so callers can read sizes without extra syscalls.
+    """
+    pending = [str(root_dir)]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip excluded directories
+                            if entry.name not in exclude_dirs:
+                                pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError as e:
+                        print(f"Warning: Could not read {entry.path}: {e}")
+        except OSError as e:
+            print(f"Warning: Could not scan {current}: {e}")
+
+
+def group_files_by_size(root_dir: Path, exclude_dirs: AbstractSet[str],
+                        min_size: int = 1) -> Tuple[Dict[int, List[str]], Dict[str, List[str]]]:
+    """Bucket file paths by size.
+
+    Hardlinks to the same file (same device and inode) are only bucketed
+    once; the other links are returned in a second dict mapping the bucketed
+    path to its extra links. Windows does not report inode numbers in
+    directory listings, so hardlinks are not detected there.
 
+    Paths are kept as plain strings; only files that turn out to be
+    duplicates are turned into Path objects.
 
-def scan_for_duplicates(root_dir: Path, exclude_dirs: Set[str] = None) -> Dict[str, List[Path]]:
-    """Scan directory for duplicate files and return hash -> file_paths mapping."""
-    if exclude_dirs is None:
-        exclude_dirs = set()
+    Files smaller than min_size are skipped, except empty files, which are
+    kept in the 0 bucket so they can be reported as one group.
+    """
+    sizes = defaultdict(list)
+    hardlinks = defaultdict(list)
+    seen_inodes = {}
     
-    file_hashes = defaultdict(list)
-    total_files = 0
+    for entry in iter_files(root_dir, exclude_dirs):
+        try:
+            # DirEntry caches the stat result; no extra syscall on Windows
+            st = entry.stat(follow_symlinks=False)
+        except OSError as e:
+            print(f"Warning: Could not read {entry.path}: {e}")
+            continue
+        if st.st_size and st.st_size < min_size:
+            continue
+        if st.st_nlink > 1 and st.st_ino:
+            # Hardlinks share content; only the first link found is hashed
+            first = seen_inodes.setdefault((st.st_dev, st.st_ino), entry.path)
+            if first != entry.path:
+                hardlinks[first].append(entry.path)
+                continue
+        sizes[st.st_size].append(entry.path)
+    
+    return sizes, hardlinks
+
+
+def expand_hardlinks(paths: List[str], hardlinks: Dict[str, List[str]]) -> List[Path]:
+    """Return Paths for a duplicate group, with each file followed by its other hardlinks."""
+    expanded = []
+    for file_path in paths:
+        expanded.append(Path(file_path))
+        expanded.extend(Path(link) for link in hardlinks.get(file_path, ()))
+    return expanded
+
+
+def group_by_digest(size: int, paths: List[str], hashes: List[bytes],
+                    hardlinks: Dict[str, List[str]]) -> Iterator[DuplicateGroup]:
+    """Yield (digest, size, paths) for every digest shared by more than one file, hardlinks included."""
+    # paths and hashes are parallel lists; sorting the indices by hash puts
+    # duplicates next to each other without a per-hash list for every file.
+    # The sort is stable, so within a group the first file found is kept.
+    order = sorted((i for i in range(len(paths)) if hashes[i]), key=hashes.__getitem__)
+    start = 0
+    while start < len(order):
+        end = start + 1
+        while end < len(order) and hashes[order[end]] == hashes[order[start]]:
+            end += 1
+        if end - start > 1:
+            yield hashes[order[start]], size, expand_hardlinks([paths[i] for i in order[start:end]], hardlinks)
+        start = end
+
+
+def hash_buckets(buckets: List[List[str]], algorithm: str,
+                 cache: Optional[sqlite3.Connection]) -> Iterator[Tuple[List[str], List[bytes]]]:
+    """Hash every file in the candidate buckets, yielding (paths, digests) per bucket.
+
+    Files are hashed on a thread pool with a bounded number in flight; each
+    bucket is yielded, in order, as soon as all of its files are hashed so it
+    can be grouped and released.
+    """
+    total_files = sum(len(paths) for paths in buckets)
     processed_files = 0
+    cached_files = 0
+    new_entries = []
+    last_progress = time.monotonic()
     
-    print("Scanning files and calculating hashes...")
+    # Each active bucket is [paths, digests, cache keys, files remaining]
+    active = deque()
     
-    # First pass: count total files
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Skip excluded directories
-        dir_path = Path(dirpath)
-        if any(exclude_dir in dir_path.parts for exclude_dir in exclude_dirs):
-            continue
-        total_files += len(filenames)
+    def jobs():
+        for paths in buckets:
+            bucket = [paths, [b""] * len(paths), [None] * len(paths), len(paths)]
+            active.append(bucket)
+            for index in range(len(paths)):
+                yield bucket, index
     
-    # Second pass: calculate hashes
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        dir_path = Path(dirpath)
-        
-        # Skip excluded directories
-        if any(exclude_dir in dir_path.parts for exclude_dir in exclude_dirs):
-            continue
-        
-        for filename in filenames:
-            file_path = dir_path / filename
-            processed_files += 1
+    pending = jobs()
+    exhausted = False
+    
+    # hashlib releases the GIL while hashing, so threads overlap reads and hashing.
+    # Run a few more threads than cores to keep several reads queued at the
+    # device (SSDs serve concurrent requests in parallel).
+    workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        while not exhausted or in_flight or active:
+            # Keep a bounded number of files in flight
+            for _ in range(2 * workers - len(in_flight)):
+                job = next(pending, None)
+                if job is None:
+                    exhausted = True
+                    break
+                bucket, index = job
+                
+                # Reuse hashes from earlier runs for files that haven't changed
+                if cache is not None:
+                    bucket[2][index] = cache_key(bucket[0][index])
+                    if bucket[2][index] is not None:
+                        bucket[1][index] = lookup_cached_hash(cache, bucket[2][index], algorithm)
+                if bucket[1][index]:
+                    bucket[3] -= 1
+                    processed_files += 1
+                    cached_files += 1
+                else:
+                    future = executor.submit(calculate_file_hash, bucket[0][index], algorithm=algorithm)
+                    in_flight[future] = job
             
-            if processed_files % 10 == 0 or processed_files == total_files:
-                print(f"  Progress: {processed_files}/{total_files} files processed", end='\r')
+            if in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    bucket, index = in_flight.pop(future)
+                    bucket[1][index] = future.result()
+                    bucket[3] -= 1
+                    processed_files += 1
+                    if bucket[1][index] and bucket[2][index] is not None:
+                        new_entries.append((bucket[2][index], bucket[1][index]))
+                    
+                    # Redraw at most every 200 ms; printing is slow on Windows consoles
+                    now = time.monotonic()
+                    if now - last_progress > 0.2 or processed_files == total_files:
+                        print(f"  Progress: {processed_files}/{total_files} files processed", end='\r')
+                        last_progress = now
             
-            file_hash = calculate_file_hash(file_path)
-            if file_hash:  # Only add if hash was successfully calculated
-                file_hashes[file_hash].append(file_path)
+            while active and active[0][3] == 0:
+                paths, hashes, _, _ = active.popleft()
+                yield paths, hashes
+            
+            if cache is not None and len(new_entries) >= 1000:
+                store_cached_hashes(cache, new_entries, algorithm)
+                new_entries = []
+    
+    if cache is not None:
+        store_cached_hashes(cache, new_entries, algorithm)
+    
+    print(f"\n  Completed: {processed_files} files hashed ({cached_files} from cache)")
+
+
+def iter_duplicate_groups(root_dir: Path, exclude_dirs: AbstractSet[str] = None, algorithm: str = DEFAULT_ALGORITHM,
+                          use_cache: bool = True, min_size: int = 1) -> Iterator[DuplicateGroup]:
+    """Scan directory for duplicate files, yielding (hash, size, file_paths) for each set found.
+
+    Only one candidate bucket's hashes are held at a time (plus the files
+    being hashed), rather than a hash for every file in the tree.
+    """
+    # Matched against each directory's own name before descending into it
+    exclude_dirs = frozenset(exclude_dirs or ())
+    
+    print("Scanning files...")
+    sizes, hardlinks = group_files_by_size(root_dir, exclude_dirs, min_size)
+    total_files = sum(len(paths) for paths in sizes.values()) + sum(len(links) for links in hardlinks.values())
+    
+    # Empty files are all identical; report them as one group without hashing
+    empty_files = sizes.pop(0, [])
     
-    print(f"\n  Completed: {processed_files} files processed")
+    # Files can only be duplicates of files with the same size
+    same_size = [(size, paths) for size, paths in sizes.items() if len(paths) > 1]
+    del sizes
+    print(f"  Found {total_files} files, {sum(len(paths) for _, paths in same_size)} share a size with another file")
     
-    # Filter to only return duplicates (more than one file with same hash)
-    duplicates = {hash_val: paths for hash_val, paths in file_hashes.items() if len(paths) > 1}
+    if len(empty_files) > 1:
+        empty_digest = blake3.blake3().digest() if algorithm == "blake3" else hashlib.sha256().digest()
+        yield empty_digest, 0, expand_hardlinks(empty_files, hardlinks)
     
-    return duplicates
+    # Sub-bucket by a head/tail fingerprint so only likely matches are read in full
+    candidates = []
+    candidate_sizes = []
+    for size, paths in same_size:
+        fingerprints = defaultdict(list)
+        for file_path in paths:
+            fingerprint = quick_fingerprint(file_path)
+            if fingerprint:
+                fingerprints[fingerprint].append(file_path)
+        for group in fingerprints.values():
+            if len(group) > 1:
+                candidates.append(group)
+                candidate_sizes.append(size)
+    del same_size
+    
+    print("Calculating hashes...")
+    cache = open_hash_cache() if use_cache else None
+    try:
+        # hash_buckets yields buckets in the order they were passed in
+        for size, (paths, hashes) in zip(candidate_sizes, hash_buckets(candidates, algorithm, cache)):
+            yield from group_by_digest(size, paths, hashes, hardlinks)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
-def display_duplicates(duplicates: Dict[str, List[Path]]) -> None:
+def display_duplicates(duplicates: List[DuplicateGroup]) -> None:
     """Display found duplicates in a readable format."""
     if not duplicates:
         print("No duplicate files found!")
         return
     
-    total_duplicate_files = sum(len(paths) - 1 for paths in duplicates.values())  # -1 because we keep one copy
+    total_duplicate_files = 0
     total_duplicate_size = 0
     
     print(f"\nFound {len(duplicates)} sets of duplicate files:")
     print("=" * 60)
     
-    for i, (file_hash, file_paths) in enumerate(duplicates.items(), 1):
-        file_size = get_file_size_mb(file_paths[0])
+    for i, (file_hash, size, file_paths) in enumerate(duplicates, 1):
+        # Size comes from the scan; no need to stat the file again
+        file_size = bytes_to_mb(size)
+        total_duplicate_files += len(file_paths) - 1  # -1 because we keep one copy
         duplicate_size = file_size * (len(file_paths) - 1)  # Size of files that would be removed
         total_duplicate_size += duplicate_size
         
         print(f"\nDuplicate Set #{i} ({len(file_paths)} files, {file_size:.2f} MB each):")
-        print(f"  Hash: {file_hash[:16]}...")
+        print(f"  Hash: {file_hash.hex()[:16]}...")
         
         for j, path in enumerate(file_paths):
             status = "[KEEP]" if j == 0 else "[DUPLICATE]"
@@ -164,7 +483,18 @@ def get_user_choice() -> str:
             print("Please enter 'r', 'm', or 'q'")
 
 
-def move_duplicates(duplicates: Dict[str, List[Path]], base_dir: Path) -> int:
+def unique_name(file_path: Path, used_names: Set[str]) -> str:
+    """Pick a name not in used_names (adding _copyN if needed) and reserve it."""
+    dest_name = file_path.name
+    counter = 1
+    while os.path.normcase(dest_name) in used_names:
+        dest_name = f"{file_path.stem}_copy{counter}{file_path.suffix}"
+        counter += 1
+    used_names.add(os.path.normcase(dest_name))
+    return dest_name
+
+
+def move_duplicates(duplicates: List[DuplicateGroup], base_dir: Path) -> int:
     """Move duplicate files to a timestamped folder."""
     if not duplicates:
         return 0
@@ -177,27 +507,26 @@ def move_duplicates(duplicates: Dict[str, List[Path]], base_dir: Path) -> int:
     moved_count = 0
     failed_count = 0
     
+    # Track taken names in memory instead of probing the folder for each file
+    used_names = {os.path.normcase(name) for name in os.listdir(duplicates_dir)}
+    
     print(f"\nMoving duplicates to: {duplicates_dir}")
     
-    for file_hash, file_paths in duplicates.items():
+    for file_hash, _, file_paths in duplicates:
         # Keep the first file, move the rest
         for i, duplicate_path in enumerate(file_paths[1:], 1):
             try:
                 # Create unique filename if needed
-                dest_name = duplicate_path.name
+                dest_name = unique_name(duplicate_path, used_names)
                 dest_path = duplicates_dir / dest_name
                 
-                # Handle name conflicts
-                counter = 1
-                while dest_path.exists():
-                    stem = duplicate_path.stem
-                    suffix = duplicate_path.suffix
-                    dest_name = f"{stem}_copy{counter}{suffix}"
-                    dest_path = duplicates_dir / dest_name
-                    counter += 1
-                
-                # Move the file
-                shutil.move(str(duplicate_path), str(dest_path))
+                # Move the file; a rename is one syscall when on the same drive
+                try:
+                    os.rename(duplicate_path, dest_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(str(duplicate_path), str(dest_path))
                 print(f"  Moved: {duplicate_path.name} -> {dest_path.name}")
                 moved_count += 1
                 
@@ -213,10 +542,21 @@ def move_duplicates(duplicates: Dict[str, List[Path]], base_dir: Path) -> int:
 
 
 def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Duplicate File Finder")
+    parser.add_argument("--sha256", action="store_true", help="Hash with SHA-256 instead of BLAKE3")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or update the on-disk hash cache")
+    parser.add_argument("--min-size", type=int, default=1,
+                        help="Ignore files smaller than this many bytes (empty files are always grouped separately)")
+    args = parser.parse_args()
+    algorithm = "sha256" if args.sha256 else DEFAULT_ALGORITHM
+
     base_dir = get_base_dir()
     
     print("Duplicate File Finder")
     print(f"Scanning directory: {base_dir}")
+    print(f"Hash algorithm: {algorithm.upper()}")
     
     # Exclude common output directories from scanning
     exclude_dirs = {
@@ -240,7 +580,8 @@ def main() -> int:
     print(f"Excluding directories: {', '.join(sorted(exclude_dirs))}")
     
     # Find duplicates
-    duplicates = scan_for_duplicates(base_dir, exclude_dirs)
+    duplicates = list(iter_duplicate_groups(base_dir, exclude_dirs, algorithm, use_cache=not args.no_cache,
+                                            min_size=args.min_size))
     
     # Display results
     display_duplicates(duplicates)
@@ -19,6 +19,7 @@ Dependencies:
 - urllib.request (built-in) for downloading installers
 - subprocess (built-in) for running installers
 - winreg (built-in) for Windows registry operations
+- orjson (optional) for faster settings.json handling; falls back to json
 
 Notes:
 - Requires administrator privileges for software installation
@@ -33,6 +34,7 @@ from __future__ import annotations
 
 import sys
 import os
+import ctypes
 import subprocess
 import urllib.request
 import winreg
@@ -40,14 +42,63 @@ from pathlib import Path
 from datetime import datetime
 import tempfile
 import json
+import time
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uninstall registry keys written by the VS Code installers (user/system, x64/x86)
+VSCODE_UNINSTALL_KEYS = (
+    "{771FD6B0-FA20-440A-A002-3B3BAC16DC50}_is1",
+    "{EA457B21-F73E-494C-ACAB-524FDE069978}_is1",
+    "{D628A17A-9713-46BF-8D57-E671B46A741E}_is1",
+    "{F8A2A208-72B3-4D61-95FC-8A65D340689B}_is1",
+)
+
+# Installer downloads, keyed by the tool names used in main()
+INSTALLERS = {
+    "NVM": {
+        "url": "https://github.com/coreybutler/nvm-windows/releases/latest/download/nvm-setup.exe",
+        "filename": "nvm-setup.exe",
+        "description": "NVM for Windows",
+    },
+    "Git": {
+        "url": "https://github.com/git-for-windows/git/releases/download/v2.42.0.windows.2/Git-2.42.0.2-64-bit.exe",
+        "filename": "git-installer.exe",
+        "description": "Git for Windows",
+    },
+    "VS Code": {
+        "url": "https://code.visualstudio.com/sha/download?build=stable&os=win32-x64-user",
+        "filename": "vscode-installer.exe",
+        "description": "Visual Studio Code",
+    },
+    "Chrome": {
+        "url": "https://dl.google.com/chrome/install/latest/chrome_installer.exe",
+        "filename": "chrome-installer.exe",
+        "description": "Google Chrome",
+    },
+}
+
+# Download sizes/throughput and installer run times, written to the report so
+# slow runs can be told apart (network-bound downloads vs. slow installers)
+TIMINGS: List[str] = []
 
 
 def is_frozen() -> bool:
     return getattr(sys, "frozen", False)
 
 
+@lru_cache(maxsize=1)
 def get_base_dir() -> Path:
     # Use the executable's directory when running as a bundled EXE so output
     # (reports/downloads) is written next to the EXE; otherwise use current working dir.
@@ -59,71 +110,108 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
+@lru_cache(maxsize=1)
 def check_admin_privileges() -> bool:
     """Check if running with administrator privileges."""
     try:
-        # Try to access a system directory that requires admin rights
-        test_path = Path("C:\\Windows\\System32\\config")
-        list(test_path.iterdir())
-        return True
-    except (PermissionError, OSError):
+        # Query the process token directly; no filesystem access needed
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
         return False
 
 
-def is_in_path(program: str) -> bool:
-    """Check if a program is available in PATH."""
+# Results of where.exe lookups, filled by probe_path(); PATH doesn't change during a run
+_PATH_PROBE: Dict[str, bool] = {}
+
+
+def probe_path(programs: List[str]) -> Dict[str, bool]:
+    """Check which programs are available in PATH with a single where.exe call."""
+    found = set()
     try:
-        result = subprocess.run(
-            ["where", program],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return len(result.stdout.strip()) > 0
-    except subprocess.CalledProcessError:
-        return False
+        # where exits non-zero if any name is missing but still lists the others
+        result = subprocess.run(["where", *programs], capture_output=True, text=True)
+        found = {Path(line.strip()).stem.lower() for line in result.stdout.splitlines() if line.strip()}
+    except OSError:
+        pass
+    results = {program: program.lower() in found for program in programs}
+    _PATH_PROBE.update(results)
+    return results
 
 
-def check_registry_program(key_path: str, program_name: str) -> bool:
-    """Check if a program is installed by looking in Windows registry."""
+def is_in_path(program: str) -> bool:
+    """Check if a program is available in PATH."""
+    if program not in _PATH_PROBE:
+        probe_path([program])
+    return _PATH_PROBE[program]
+
+
+# Installation probes spawn processes (where.exe, PowerShell) or scan the
+# registry; their answers don't change during a run, so each runs only once.
+@lru_cache(maxsize=None)
+def check_registry_program(key_path: str, program_name: str, known_subkeys: tuple = ()) -> bool:
+    """Check if a program is installed by looking in Windows registry.
+
+    known_subkeys are opened directly first; only if none exists are the
+    subkeys of key_path scanned for a matching name or DisplayName.
+    """
+    # Direct probes: one OpenKey per known ID instead of walking every subkey
+    for root in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        for subkey in known_subkeys:
+            try:
+                with winreg.OpenKey(root, f"{key_path}\\{subkey}"):
+                    return True
+            except OSError:
+                pass
+    
+    needle = program_name.lower()
     try:
         with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-            i = 0
-            while True:
+            subkey_count = winreg.QueryInfoKey(key)[0]
+            for i in range(subkey_count):
+                subkey_name = winreg.EnumKey(key, i)
+                if needle in subkey_name.lower():
+                    return True
+                # Installers often use a GUID as the key name; check the display name
                 try:
-                    subkey_name = winreg.EnumKey(key, i)
-                    if program_name.lower() in subkey_name.lower():
-                        return True
-                    i += 1
+                    with winreg.OpenKey(key, subkey_name) as subkey:
+                        display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
                 except OSError:
-                    break
+                    continue
+                if needle in str(display_name).lower():
+                    return True
         return False
-    except FileNotFoundError:
+    except OSError:
         return False
 
 
+@lru_cache(maxsize=None)
 def check_nvm_installed() -> bool:
     """Check if NVM for Windows is installed."""
     nvm_path = Path(os.path.expandvars("%APPDATA%\\nvm"))
     return nvm_path.exists() or is_in_path("nvm")
 
 
+@lru_cache(maxsize=None)
 def check_node_installed() -> bool:
     """Check if Node.js is installed."""
     return is_in_path("node")
 
 
+@lru_cache(maxsize=None)
 def check_git_installed() -> bool:
     """Check if Git is installed."""
     return is_in_path("git")
 
 
+@lru_cache(maxsize=None)
 def check_vscode_installed() -> bool:
     """Check if Visual Studio Code is installed."""
     return (is_in_path("code") or 
-            check_registry_program("SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall", "Visual Studio Code"))
+            check_registry_program("SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall", "Visual Studio Code",
+                                   VSCODE_UNINSTALL_KEYS))
 
 
+@lru_cache(maxsize=None)
 def check_chrome_installed() -> bool:
     """Check if Google Chrome is installed."""
     chrome_paths = [
@@ -134,6 +222,7 @@ def check_chrome_installed() -> bool:
     return any(path.exists() for path in chrome_paths)
 
 
+@lru_cache(maxsize=None)
 def check_windows_terminal_installed() -> bool:
     """Check if Windows Terminal is installed."""
     try:
@@ -152,7 +241,15 @@ def download_file(url: str, dest_path: Path, description: str) -> bool:
     """Download a file with progress indication."""
     try:
         print(f"  📥 Downloading {description}...")
-        urllib.request.urlretrieve(url, dest_path)
+        start = time.perf_counter()
+        # Stream straight to disk in 1 MiB chunks (urlretrieve uses 8 KiB)
+        with urllib.request.urlopen(url, timeout=30) as resp, open(dest_path, "wb") as out:
+            shutil.copyfileobj(resp, out, DOWNLOAD_CHUNK_SIZE)
+            size_mib = out.tell() / (1024 * 1024)
+        elapsed = time.perf_counter() - start
+        msg = f"Downloaded {description}: {size_mib:.1f} MiB in {elapsed:.1f}s ({size_mib / max(elapsed, 1e-6):.1f} MiB/s)"
+        print(f"  ⏱️  {msg}")
+        TIMINGS.append(msg)
         return dest_path.exists()
     except Exception as e:
         print(f"  ❌ Failed to download {description}: {e}")
@@ -164,6 +261,7 @@ def run_installer(installer_path: Path, args: list = None, description: str = ""
     if args is None:
         args = []
     
+    start = time.perf_counter()
     try:
         print(f"  🔧 Installing {description}...")
         cmd = [str(installer_path)] + args
@@ -172,24 +270,38 @@ def run_installer(installer_path: Path, args: list = None, description: str = ""
     except subprocess.CalledProcessError as e:
         print(f"  ❌ Installation failed for {description}: {e}")
         return False
-
-
-def install_nvm() -> bool:
-    """Install NVM for Windows."""
+    finally:
+        TIMINGS.append(f"Ran {description} installer in {time.perf_counter() - start:.1f}s")
+
+
+def download_installers(tools: List[str], downloads_dir: Path) -> Dict[str, Optional[Path]]:
+    """Download the installers for the given tools concurrently.
+
+    Returns the installer path for each tool, or None if its download failed.
+    Only the downloads run in parallel; installers are run one at a time later.
+    """
+    installers = {}
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {}
+        for tool in tools:
+            spec = INSTALLERS[tool]
+            dest = downloads_dir / spec["filename"]
+            futures[executor.submit(download_file, spec["url"], dest, spec["description"])] = (tool, dest)
+        for future in as_completed(futures):
+            tool, dest = futures[future]
+            installers[tool] = dest if future.result() else None
+    return installers
+
+
+def install_nvm(installer: Optional[Path]) -> bool:
+    """Install NVM for Windows from its downloaded installer."""
     print("📦 Installing NVM for Windows...")
     
-    downloads_dir = get_base_dir() / "downloads"
-    downloads_dir.mkdir(exist_ok=True)
-    
-    # Download NVM for Windows installer
-    nvm_url = "https://github.com/coreybutler/nvm-windows/releases/latest/download/nvm-setup.exe"
-    nvm_installer = downloads_dir / "nvm-setup.exe"
-    
-    if not download_file(nvm_url, nvm_installer, "NVM for Windows"):
+    if installer is None:
         return False
     
     # Install NVM silently
-    success = run_installer(nvm_installer, ["/S"], "NVM for Windows")
+    success = run_installer(installer, ["/S"], "NVM for Windows")
     
     if success:
         print("  ✅ NVM for Windows installed successfully!")
@@ -227,21 +339,11 @@ def install_node_via_nvm() -> bool:
         return False
 
 
-def install_git() -> bool:
-    """Install Git for Windows."""
+def install_git(installer: Optional[Path]) -> bool:
+    """Install Git for Windows from its downloaded installer."""
     print("📦 Installing Git for Windows...")
     
-    downloads_dir = get_base_dir() / "downloads"
-    downloads_dir.mkdir(exist_ok=True)
-    
-    # Download Git for Windows installer
-    git_url = "https://github.com/git-for-windows/git/releases/latest/download/Git-2.42.0.2-64-bit.exe"
-    git_installer = downloads_dir / "git-installer.exe"
-    
-    # Use a more reliable download URL
-    git_url = "https://github.com/git-for-windows/git/releases/download/v2.42.0.windows.2/Git-2.42.0.2-64-bit.exe"
-    
-    if not download_file(git_url, git_installer, "Git for Windows"):
+    if installer is None:
         return False
     
     # Install Git with default settings
@@ -251,7 +353,7 @@ def install_git() -> bool:
         "/COMPONENTS=ext,ext\\shellhere,ext\\guihere,gitlfs,assoc,assoc_sh"
     ]
     
-    success = run_installer(git_installer, git_args, "Git for Windows")
+    success = run_installer(installer, git_args, "Git for Windows")
     
     if success:
         print("  ✅ Git for Windows installed successfully!")
@@ -259,18 +361,11 @@ def install_git() -> bool:
     return success
 
 
-def install_vscode() -> bool:
-    """Install Visual Studio Code."""
+def install_vscode(installer: Optional[Path]) -> bool:
+    """Install Visual Studio Code from its downloaded installer."""
     print("📦 Installing Visual Studio Code...")
     
-    downloads_dir = get_base_dir() / "downloads"
-    downloads_dir.mkdir(exist_ok=True)
-    
-    # Download VS Code installer
-    vscode_url = "https://code.visualstudio.com/sha/download?build=stable&os=win32-x64-user"
-    vscode_installer = downloads_dir / "vscode-installer.exe"
-    
-    if not download_file(vscode_url, vscode_installer, "Visual Studio Code"):
+    if installer is None:
         return False
     
     # Install VS Code silently
@@ -280,7 +375,7 @@ def install_vscode() -> bool:
         "/MERGETASKS=!runcode,addcontextmenufiles,addcontextmenufolders,associatewithfiles,addtopath"
     ]
     
-    success = run_installer(vscode_installer, vscode_args, "Visual Studio Code")
+    success = run_installer(installer, vscode_args, "Visual Studio Code")
     
     if success:
         print("  ✅ Visual Studio Code installed successfully!")
@@ -288,22 +383,15 @@ def install_vscode() -> bool:
     return success
 
 
-def install_chrome() -> bool:
-    """Install Google Chrome."""
+def install_chrome(installer: Optional[Path]) -> bool:
+    """Install Google Chrome from its downloaded installer."""
     print("📦 Installing Google Chrome...")
     
-    downloads_dir = get_base_dir() / "downloads"
-    downloads_dir.mkdir(exist_ok=True)
-    
-    # Download Chrome installer
-    chrome_url = "https://dl.google.com/chrome/install/latest/chrome_installer.exe"
-    chrome_installer = downloads_dir / "chrome-installer.exe"
-    
-    if not download_file(chrome_url, chrome_installer, "Google Chrome"):
+    if installer is None:
         return False
     
     # Install Chrome silently
-    success = run_installer(chrome_installer, ["/S"], "Google Chrome")
+    success = run_installer(installer, ["/S"], "Google Chrome")
     
     if success:
         print("  ✅ Google Chrome installed successfully!")
@@ -358,15 +446,17 @@ def create_vscode_settings() -> None:
         if settings_file.exists():
             # Merge with existing settings
             try:
-                with open(settings_file, 'r') as f:
-                    existing_settings = json.load(f)
-                existing_settings.update(recommended_settings)
-                recommended_settings = existing_settings
-            except (json.JSONDecodeError, IOError):
+                data = settings_file.read_bytes()
+                existing_settings = orjson.loads(data) if orjson is not None else json.loads(data)
+                recommended_settings = existing_settings | recommended_settings
+            except (ValueError, TypeError, IOError):
                 pass
         
-        with open(settings_file, 'w') as f:
-            json.dump(recommended_settings, f, indent=2)
+        if orjson is not None:
+            settings_file.write_bytes(orjson.dumps(recommended_settings, option=orjson.OPT_INDENT_2))
+        else:
+            with open(settings_file, 'w') as f:
+                json.dump(recommended_settings, f, indent=2)
         
         print("  ✅ VS Code settings configured for JavaScript development!")
         
@@ -416,6 +506,9 @@ def main() -> int:
     # Check current installation status
     print("\n🔍 Checking current installation status...")
     
+    # One where.exe call for every PATH check below
+    probe_path(["nvm", "node", "git", "code"])
+    
     tools_status = {
         "NVM": check_nvm_installed(),
         "Node.js": check_node_installed(),
@@ -438,6 +531,14 @@ def main() -> int:
     installation_results = {}
     actions_log = []  # collect human readable actions for report
     
+    # Fetch every missing installer up front, in parallel; the installers
+    # themselves still run one after another below
+    installers = {}
+    missing = [tool for tool in INSTALLERS if not tools_status[tool]]
+    if missing and can_install and not dry_run:
+        print(f"  📥 Downloading {len(missing)} installer(s) in parallel...")
+        installers = download_installers(missing, downloads_dir)
+    
     # Install NVM first (required for Node.js)
     if not tools_status["NVM"]:
         if dry_run:
@@ -454,7 +555,7 @@ def main() -> int:
             msg = "Downloading and installing NVM for Windows"
             print(f"  {msg}...")
             actions_log.append(msg)
-            installation_results["NVM"] = install_nvm()
+            installation_results["NVM"] = install_nvm(installers.get("NVM"))
             actions_log.append(f"  Result: {'Success' if installation_results['NVM'] else 'Failed'}")
     else:
         msg = "NVM already installed, skipped"
@@ -507,7 +608,7 @@ def main() -> int:
             msg = "Downloading and installing Git for Windows"
             print(f"  {msg}...")
             actions_log.append(msg)
-            installation_results["Git"] = install_git()
+            installation_results["Git"] = install_git(installers.get("Git"))
             actions_log.append(f"  Result: {'Success' if installation_results['Git'] else 'Failed'}")
     else:
         msg = "Git already installed, skipped"
@@ -531,7 +632,7 @@ def main() -> int:
             msg = "Downloading and installing Visual Studio Code"
             print(f"  {msg}...")
             actions_log.append(msg)
-            installation_results["VS Code"] = install_vscode()
+            installation_results["VS Code"] = install_vscode(installers.get("VS Code"))
             actions_log.append(f"  Result: {'Success' if installation_results['VS Code'] else 'Failed'}")
     else:
         msg = "VS Code already installed, skipped"
@@ -555,7 +656,7 @@ def main() -> int:
             msg = "Downloading and installing Google Chrome"
             print(f"  {msg}...")
             actions_log.append(msg)
-            installation_results["Chrome"] = install_chrome()
+            installation_results["Chrome"] = install_chrome(installers.get("Chrome"))
             actions_log.append(f"  Result: {'Success' if installation_results['Chrome'] else 'Failed'}")
     else:
         msg = "Chrome already installed, skipped"
@@ -633,18 +734,19 @@ def main() -> int:
     try:
         report_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = base_dir / f"js_dev_setup_report_{report_timestamp}.txt"
-        with open(report_file, 'w', encoding='utf-8') as rf:
-            rf.write(f"JavaScript Dev Setup Report - {report_timestamp}\n")
-            rf.write("\nDetected tool status:\n")
-            for tool, installed in tools_status.items():
-                rf.write(f"  {tool}: {'Installed' if installed else 'Not found'}\n")
-            rf.write("\nActions performed:\n")
-            for line in actions_log:
-                rf.write(f"  {line}\n")
-            rf.write("\nSummary:\n")
-            for tool, success in installation_results.items():
-                rf.write(f"  {tool}: {'Success' if success else 'Failed'}\n")
-            rf.write(f"\nDry-run: {dry_run}\n")
+        # Assemble the whole report first and write it in one call
+        lines = [f"JavaScript Dev Setup Report - {report_timestamp}", "", "Detected tool status:"]
+        lines += [f"  {tool}: {'Installed' if installed else 'Not found'}" for tool, installed in tools_status.items()]
+        lines += ["", "Actions performed:"]
+        lines += [f"  {line}" for line in actions_log]
+        if TIMINGS:
+            lines += ["", "Timings:"]
+            lines += [f"  {line}" for line in TIMINGS]
+        lines += ["", "Summary:"]
+        lines += [f"  {tool}: {'Success' if success else 'Failed'}" for tool, success in installation_results.items()]
+        lines += ["", f"Dry-run: {dry_run}", ""]
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 16) as rf:
+            rf.write("\n".join(lines))
         
         print(f"\n📝 Report written: {report_file}")
     except Exception as e:
@@ -10,7 +10,8 @@ Behavior:
 Dependencies:
 - rawpy (LibRaw bindings) for decoding NEF
 - Pillow (PIL) for saving JPEG
-- exifread (for orientation correction)
+- exifread (optional, for orientation correction)
+- PyTurboJPEG (optional) for faster JPEG encoding via libjpeg-turbo; Pillow is used otherwise
 
 Notes:
 - If double-clicking the EXE, a prompt at the end will keep the console open.
@@ -20,14 +21,42 @@ from __future__ import annotations
 
 import sys
 import os
+import hashlib
+import mmap
+import multiprocessing
+import struct
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Set, Union
+
+# main() runs one conversion per core; LibRaw's OpenMP demosaic starting its own
+# thread per core on top of that would oversubscribe the CPU. OpenMP reads this
+# when the library loads, so it has to be set before rawpy is imported (pool
+# worker processes inherit it).
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+# Imported once per process rather than on every conversion; None when missing
+try:
+	import rawpy as _RAWPY  # type: ignore
+except ImportError:
+	_RAWPY = None
+try:
+	from PIL import Image as _IMAGE  # type: ignore
+except ImportError:
+	_IMAGE = None
+try:
+	import exifread as _EXIFREAD  # type: ignore
+except ImportError:
+	_EXIFREAD = None
 
 
 def is_frozen() -> bool:
 	return getattr(sys, "frozen", False)
 
 
+@lru_cache(maxsize=1)
 def get_base_dir() -> Path:
 	# For packaged EXE, use the EXE location; for script, use the working directory
 	if is_frozen():
@@ -35,173 +64,316 @@ def get_base_dir() -> Path:
 	return Path.cwd()
 
 
-def iter_nef_files(root: Path) -> Iterable[Path]:
-	for dirpath, dirnames, filenames in os.walk(root):
-		# Skip the results folder itself if it already exists
-		if Path(dirpath) == (root / "results"):
+def iter_nef_files(root: Path) -> Iterable[str]:
+	"""Yield NEF paths under root as plain strings; callers build Paths only as needed."""
+	results_dir = str(root / "results")
+	pending = [str(root)]
+	while pending:
+		current = pending.pop()
+		try:
+			with os.scandir(current) as entries:
+				for entry in entries:
+					# DirEntry type checks use the directory listing; no extra stat calls
+					if entry.is_dir(follow_symlinks=False):
+						# Skip the results folder if it already exists
+						if entry.path != results_dir:
+							pending.append(entry.path)
+					elif entry.name.lower().endswith(".nef") and entry.is_file():
+						yield entry.path
+		except OSError:
 			continue
-		for name in filenames:
-			if name.lower().endswith(".nef"):
-				yield Path(dirpath) / name
 
 
-def unique_path(path: Path) -> Path:
-	if not path.exists():
-		return path
-	base = path.with_suffix("")
-	suffix = path.suffix
-	i = 1
-	while True:
-		cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
-		if not cand.exists():
-			return cand
-		i += 1
+def deduplicated_path(out_path: Path, nef: str, claimed: Set[str]) -> Path:
+	"""Return out_path, or a name with a short hash of the NEF's file name if this run already uses it.
 
+	Only NEFs in one folder whose names differ just in case (a.NEF, a.nef)
+	map to the same JPG. claimed holds the normcased outputs handed out so
+	far. The suffix depends only on the source name, so a re-run writes the
+	same names again (overwriting its earlier output) instead of adding copies.
+	"""
+	key = os.path.normcase(str(out_path))
+	if key in claimed:
+		digest = hashlib.blake2s(os.path.basename(nef).encode(), digest_size=4).hexdigest()
+		out_path = out_path.with_name(f"{out_path.stem}_{digest}{out_path.suffix}")
+		key = os.path.normcase(str(out_path))
+	claimed.add(key)
+	return out_path
+
+
+@lru_cache(maxsize=None)
+def _turbojpeg():
+	"""Return a shared TurboJPEG encoder, or None if PyTurboJPEG/libjpeg-turbo is unavailable."""
+	try:
+		from turbojpeg import TurboJPEG  # type: ignore
+		return TurboJPEG()
+	except Exception:  # module missing or libturbojpeg DLL not found
+		return None
 
-def _save_jpeg_array(arr, out_path: Path, quality: int) -> Path:
-	from PIL import Image  # type: ignore
-	import exifread  # type: ignore
 
-	img = Image.fromarray(arr)
+# EXIF Orientation tag; 1 means upright
+_EXIF_ORIENTATION = 0x0112
 
-	# Try to read EXIF orientation from the NEF file and apply it
+
+def _exif_orientation(nef_path: Union[str, Path]) -> Optional[int]:
+	"""Read the numeric EXIF orientation (1-8) of a NEF, if any."""
+	if _EXIFREAD is None:
+		return None
 	try:
-		nef_path = out_path.with_suffix('.nef')
-		if nef_path.exists():
-			with open(nef_path, 'rb') as f:
-				tags = exifread.process_file(f, stop_tag="Orientation", details=False)
-				orientation = tags.get("Image Orientation")
-				if orientation:
-					val = str(orientation)
-					if val == "Rotated 180":
-						img = img.rotate(180, expand=True)
-					elif val == "Rotated 90 CW":
-						img = img.rotate(270, expand=True)
-					elif val == "Rotated 90 CCW":
-						img = img.rotate(90, expand=True)
-					elif val == "Mirrored":
-						img = img.transpose(Image.FLIP_LEFT_RIGHT)
-					elif val == "Mirrored horizontal and rotated 90 CW":
-						img = img.transpose(Image.FLIP_TOP_BOTTOM).rotate(270, expand=True)
-					elif val == "Mirrored horizontal and rotated 90 CCW":
-						img = img.transpose(Image.FLIP_TOP_BOTTOM).rotate(90, expand=True)
-					elif val == "Mirrored vertical":
-						img = img.transpose(Image.FLIP_TOP_BOTTOM)
+		with open(nef_path, 'rb') as f:
+			tags = _EXIFREAD.process_file(f, stop_tag="Orientation", details=False)
+			orientation = tags.get("Image Orientation")
+			if orientation:
+				return int(orientation.values[0])
 	except Exception:
-		pass  # If exifread or orientation fails, just save as is
+		pass  # If exifread fails, just save as is
+	return None
 
-	target = unique_path(out_path.with_suffix(".jpg"))
-	target.parent.mkdir(parents=True, exist_ok=True)
-	img.save(target, format="JPEG", quality=quality, optimize=True, subsampling=0)
+
+def _save_jpeg_array(arr, out_path: Path, quality: int, fast: bool = False,
+					 source: Optional[Union[str, Path]] = None) -> Path:
+	# Apply the source NEF's EXIF orientation; postprocess() output is already
+	# rotated by LibRaw, so only unrotated images pass their source
+	orientation = _exif_orientation(source) if source is not None else None
+
+	target = out_path.with_suffix(".jpg")
+
+	# libjpeg-turbo's SIMD encoder, when installed; upright images only
+	jpeg = _turbojpeg()
+	if jpeg is not None and orientation in (None, 1):
+		from turbojpeg import TJPF_RGB, TJSAMP_420, TJSAMP_444  # type: ignore
+		subsample = TJSAMP_420 if fast else TJSAMP_444
+		target.write_bytes(jpeg.encode(arr, quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=subsample))
+		return target
+
+	img = _IMAGE.fromarray(arr)
+	if orientation and orientation != 1:
+		# Let Pillow apply the transpose/rotation for the numeric orientation
+		from PIL import ImageOps  # type: ignore
+		img.getexif()[_EXIF_ORIENTATION] = orientation
+		img = ImageOps.exif_transpose(img)
+	# No optimize=True: the extra Huffman pass costs far more than the bytes it saves
+	# --fast uses 4:2:0 chroma subsampling: half the chroma data to encode
+	img.save(target, format="JPEG", quality=quality, subsampling=2 if fast else 0, progressive=False)
 	return target
 
 
-def _try_raw_full(raw, out_path: Path, quality: int) -> Optional[Path]:
+def _speed_args(fast: bool) -> dict:
+	"""Extra postprocess() arguments for --fast: cheap linear demosaic, no FBDD denoise."""
+	if not fast:
+		return {}  # LibRaw defaults (AHD demosaic)
+	return {
+		"demosaic_algorithm": _RAWPY.DemosaicAlgorithm.LINEAR,
+		"fbdd_noise_reduction": _RAWPY.FBDDNoiseReductionMode.Off,
+	}
+
+
+def _try_raw_full(raw, out_path: Path, quality: int, fast: bool = False) -> Optional[Path]:
 	try:
 		rgb = raw.postprocess(
 			use_auto_wb=True,
 			no_auto_bright=True,
 			output_bps=8,
 			gamma=(2.222, 4.5),
+			**_speed_args(fast),
 		)
-		return _save_jpeg_array(rgb, out_path, quality)
+		return _save_jpeg_array(rgb, out_path, quality, fast)
 	except Exception:
 		return None
 
 
-def _try_raw_half(raw, out_path: Path, quality: int) -> Optional[Path]:
+def _try_raw_half(raw, out_path: Path, quality: int, fast: bool = False) -> Optional[Path]:
 	try:
 		rgb = raw.postprocess(
 			use_auto_wb=True,
 			no_auto_bright=True,
 			output_bps=8,
 			half_size=True,
+			**_speed_args(fast),
 		)
-		return _save_jpeg_array(rgb, out_path, quality)
+		return _save_jpeg_array(rgb, out_path, quality, fast)
 	except Exception:
 		return None
 
 
-def _try_libraw_thumb(raw, out_path: Path) -> Optional[Path]:
-	import rawpy  # type: ignore
-
+def _try_libraw_thumb(raw, in_path: Union[str, Path], out_path: Path) -> Optional[Path]:
 	try:
 		thumb = raw.extract_thumb()
-		target = unique_path(out_path.with_suffix(".jpg"))
-		target.parent.mkdir(parents=True, exist_ok=True)
-		if getattr(thumb, "format", None) == getattr(rawpy, "ThumbFormat").JPEG:
+		target = out_path.with_suffix(".jpg")
+		if getattr(thumb, "format", None) == _RAWPY.ThumbFormat.JPEG:
 			with open(target, "wb") as f:
 				f.write(thumb.data)
 			return target
 		else:
 			# Some thumbnails are RGB arrays
-			return _save_jpeg_array(thumb.data, out_path, 90)
+			return _save_jpeg_array(thumb.data, out_path, 90, source=in_path)
 	except Exception:
 		return None
 
 
-def _try_scan_embedded_jpeg(in_path: Path, out_path: Path) -> Optional[Path]:
-	data = in_path.read_bytes()
+# TIFF tags locating embedded JPEG previews (NEF files are TIFF containers)
+_TIFF_SUBIFDS = 0x014A
+_TIFF_JPEG_OFFSET = 0x0201
+_TIFF_JPEG_LENGTH = 0x0202
+# The brute-force scan settles for the first embedded JPEG at least this large
+_MIN_PREVIEW_BYTES = 64 * 1024
+
+
+def _tiff_jpeg_ranges(mm) -> list[tuple[int, int]]:
+	"""Return (start, end) of every JPEG the TIFF IFDs (and SubIFDs) point at."""
+	order = {b"II": "<", b"MM": ">"}.get(mm[:2])
+	if order is None or len(mm) < 8 or struct.unpack_from(order + "H", mm, 2)[0] != 42:
+		return []
+	size = len(mm)
+	ranges: list[tuple[int, int]] = []
+	pending = [struct.unpack_from(order + "I", mm, 4)[0]]
+	seen = set()
+	try:
+		while pending:
+			ifd = pending.pop()
+			if not ifd or ifd in seen or ifd + 2 > size:
+				continue
+			seen.add(ifd)
+			count = struct.unpack_from(order + "H", mm, ifd)[0]
+			if ifd + 2 + count * 12 + 4 > size:
+				continue
+			tags = {}
+			for n in range(count):
+				tag, typ, cnt, value = struct.unpack_from(order + "HHII", mm, ifd + 2 + n * 12)
+				if typ in (4, 13):  # LONG / IFD values fill the whole value field
+					tags[tag] = (cnt, value)
+			sub = tags.get(_TIFF_SUBIFDS)
+			if sub:
+				cnt, value = sub
+				if cnt == 1:
+					pending.append(value)
+				elif value + 4 * cnt <= size:
+					pending.extend(struct.unpack_from(f"{order}{cnt}I", mm, value))
+			if _TIFF_JPEG_OFFSET in tags and _TIFF_JPEG_LENGTH in tags:
+				begin = tags[_TIFF_JPEG_OFFSET][1]
+				end = begin + tags[_TIFF_JPEG_LENGTH][1]
+				if end <= size and mm[begin:begin + 2] == b"\xFF\xD8":
+					ranges.append((begin, end))
+			pending.append(struct.unpack_from(order + "I", mm, ifd + 2 + count * 12)[0])
+	except struct.error:
+		pass  # truncated or odd IFD: keep whatever was found
+	return ranges
+
+
+def _scan_jpeg_ranges(mm) -> list[tuple[int, int]]:
+	"""Brute-force SOI...EOI scan, stopping at the first preview-sized match."""
 	soi = b"\xFF\xD8\xFF"
 	eoi = b"\xFF\xD9"
-	starts = []
-	i = 0
-	while True:
-		j = data.find(soi, i)
+	candidates: list[tuple[int, int]] = []
+	s = mm.find(soi)
+	while s != -1:
+		j = mm.find(eoi, s + 2)
 		if j == -1:
+			break  # no later start can have an end marker either
+		candidates.append((s, j + len(eoi)))
+		if j + len(eoi) - s >= _MIN_PREVIEW_BYTES:
 			break
-		starts.append(j)
-		i = j + 1
-
-	candidates: list[tuple[int, int]] = []
-	for s in starts:
-		j = data.find(eoi, s + 2)
-		if j != -1:
-			candidates.append((s, j + len(eoi)))
-
-	if candidates:
-		s, e = max(candidates, key=lambda p: p[1] - p[0])
-		target = unique_path(out_path.with_suffix(".jpg"))
-		target.parent.mkdir(parents=True, exist_ok=True)
-		with open(target, "wb") as f:
-			f.write(data[s:e])
-		return target
-	return None
+		s = mm.find(soi, s + 1)
+	return candidates
+
+
+def _try_scan_embedded_jpeg(in_path: Union[str, Path], out_path: Path) -> Optional[Path]:
+	with open(in_path, "rb") as src:
+		if os.fstat(src.fileno()).st_size == 0:
+			return None
+		# Map the NEF instead of copying it onto the heap
+		with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+			candidates = _tiff_jpeg_ranges(mm) or _scan_jpeg_ranges(mm)
+			if not candidates:
+				return None
+			s, e = max(candidates, key=lambda p: p[1] - p[0])
+			target = out_path.with_suffix(".jpg")
+			with open(target, "wb") as f:
+				f.write(mm[s:e])
+			return target
 
 
-def convert_nef_to_jpg(in_path: Path, out_path: Path, quality: int = 90, mode: str = "auto", verbose: bool = False) -> None:
+def convert_nef_to_jpg(in_path: Union[str, Path], out_path: Path, quality: int = 90, mode: str = "auto", verbose: bool = False,
+					   fast: bool = False) -> None:
 	"""Convert a single NEF to JPG.
 
 	mode:
 	  - auto: try RAW decode then fallbacks
 	  - raw: only RAW decode attempts
 	  - embedded: only embedded JPEG extraction attempts
+	  - preview: embedded previews first, RAW decode (half, then full) only as fallback
+	  - half: only the half-size RAW decode
+
+	fast trades some quality for speed: linear demosaic, no FBDD noise
+	reduction and 4:2:0 chroma subsampling.
+
+	The folder of out_path must already exist; main() creates each one once.
 	"""
-	import rawpy  # type: ignore
+	if _RAWPY is None and mode in ("raw", "half"):
+		raise ImportError("rawpy is required for RAW decoding (pip install rawpy)")
 
 	if verbose:
 		print(f"Converting: {in_path}")
 
 	out_path = out_path.with_suffix(".jpg")
 
-	if mode in ("auto", "raw"):
+	if mode == "half":
+		with _RAWPY.imread(os.fspath(in_path)) as raw:
+			if _try_raw_half(raw, out_path, quality, fast):
+				return
+		raise RuntimeError("Half-size RAW decode failed.")
+
+	if mode == "preview":
+		# Demosaicing dominates the cost; the camera's embedded JPEG needs none
+		raw = None
+		if _RAWPY is not None:
+			try:
+				raw = _RAWPY.imread(os.fspath(in_path))
+			except Exception as e:
+				if verbose:
+					print(f" - RAW open failed: {e}")
 		try:
-			with rawpy.imread(str(in_path)) as raw:
+			if raw is not None:
+				if verbose:
+					print(" - Trying LibRaw thumbnail…")
+				if _try_libraw_thumb(raw, in_path, out_path):
+					return
+			if verbose:
+				print(" - Trying embedded JPEG scan…")
+			if _try_scan_embedded_jpeg(in_path, out_path):
+				return
+			if raw is not None:
+				if verbose:
+					print(" - No embedded JPEG; trying RAW half-size…")
+				if _try_raw_half(raw, out_path, quality, fast):
+					return
+				if verbose:
+					print(" - RAW half failed; trying RAW full postprocess…")
+				if _try_raw_full(raw, out_path, quality, fast):
+					return
+		finally:
+			if raw is not None:
+				raw.close()
+		raise RuntimeError("All conversion attempts failed.")
+
+	if mode in ("auto", "raw") and _RAWPY is not None:
+		try:
+			with _RAWPY.imread(os.fspath(in_path)) as raw:
 				if verbose:
 					print(" - Trying RAW full postprocess…")
-				p = _try_raw_full(raw, out_path, quality)
+				p = _try_raw_full(raw, out_path, quality, fast)
 				if p:
 					return
 				if verbose:
 					print(" - RAW full failed; trying RAW half-size…")
-				p = _try_raw_half(raw, out_path, quality)
+				p = _try_raw_half(raw, out_path, quality, fast)
 				if p:
 					return
 				if mode == "raw":
 					raise RuntimeError("RAW-only mode failed (full and half-size).")
 				if verbose:
 					print(" - RAW half failed; trying LibRaw thumbnail…")
-				p = _try_libraw_thumb(raw, out_path)
+				p = _try_libraw_thumb(raw, in_path, out_path)
 				if p:
 					return
 		except Exception as e:
@@ -220,13 +392,46 @@ def convert_nef_to_jpg(in_path: Path, out_path: Path, quality: int = 90, mode: s
 	raise RuntimeError("All conversion attempts failed.")
 
 
+# rawpy releases the GIL while decoding from this version on
+_RAWPY_NOGIL_VERSION = (0, 21)
+
+
+def _rawpy_releases_gil() -> bool:
+	"""True if the installed rawpy decodes without holding the GIL, so threads can convert in parallel."""
+	try:
+		version = tuple(int(part) for part in _RAWPY.__version__.split(".")[:2])
+	except Exception:  # rawpy missing or an unparsable version
+		return False
+	return version >= _RAWPY_NOGIL_VERSION
+
+
+def _init_worker() -> None:
+	"""ProcessPoolExecutor initializer: load the codecs once per worker process."""
+	global _RAWPY, _IMAGE, _EXIFREAD
+	# Missing codecs are reported per file, not by breaking the pool
+	try:
+		import rawpy as _RAWPY  # type: ignore
+	except ImportError:
+		pass
+	try:
+		from PIL import Image as _IMAGE  # type: ignore
+	except ImportError:
+		pass
+	try:
+		import exifread as _EXIFREAD  # type: ignore
+	except ImportError:
+		pass
+
+
 def main() -> int:
 	import argparse
 
 	parser = argparse.ArgumentParser(description="NEF to JPG Converter")
-	parser.add_argument("--mode", choices=["auto", "raw", "embedded"], default="auto", help="Conversion strategy")
+	parser.add_argument("--mode", choices=["auto", "raw", "embedded", "preview", "half"], default="auto",
+						help="Conversion strategy (preview: embedded JPEG first, RAW decode only as a fallback)")
 	parser.add_argument("--quality", type=int, default=90, help="JPEG quality (1-100)")
 	parser.add_argument("--verbose", action="store_true", help="Verbose output")
+	parser.add_argument("--fast", action="store_true", help="Faster, lower-quality RAW decode and 4:2:0 JPEG encoding (combines with any --mode)")
 	args = parser.parse_args()
 
 	base_dir = get_base_dir()
@@ -234,30 +439,57 @@ def main() -> int:
 	results_dir.mkdir(exist_ok=True)
 
 	print(f"Scanning for NEF files under: {base_dir}")
-	nef_files = list(iter_nef_files(base_dir))
-	if not nef_files:
+	print(f"Converting to: {results_dir}")
+
+	ok = 0
+	failed = 0
+	# Decoding is CPU-bound and every file is independent: convert in parallel.
+	# Files are submitted while the folder scan is still running, keeping at
+	# most 2 per worker queued so conversion starts with the first file found.
+	workers = os.cpu_count() or 1
+	# Scan results all start with base_dir; slice it off instead of relative_to()
+	prefix_len = len(os.path.join(str(base_dir), ""))
+	nef_files = iter_nef_files(base_dir)
+	# Output folders are created here, once each, rather than by every conversion
+	created_dirs = {results_dir}
+	claimed: Set[str] = set()
+	# Either way OMP_NUM_THREADS (set at import) keeps LibRaw to one thread per conversion
+	if _rawpy_releases_gil():
+		# Threads share the codecs and the decoded arrays: nothing to pickle
+		executor = ThreadPoolExecutor(max_workers=workers)
+	else:
+		executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+	with executor:
+		futures = {}
+		while True:
+			for nef in islice(nef_files, 2 * workers - len(futures)):
+				out_path = deduplicated_path((results_dir / nef[prefix_len:]).with_suffix(".jpg"), nef, claimed)
+				out_dir = out_path.parent
+				if out_dir not in created_dirs:
+					out_dir.mkdir(parents=True, exist_ok=True)
+					created_dirs.add(out_dir)
+				future = executor.submit(convert_nef_to_jpg, nef, out_path, args.quality, args.mode, args.verbose, args.fast)
+				futures[future] = (nef, out_path)
+			if not futures:
+				break
+
+			done, _ = wait(futures, return_when=FIRST_COMPLETED)
+			for future in done:
+				nef, out_path = futures.pop(future)
+				try:
+					future.result()
+					ok += 1
+					print(f"[{ok + failed}] {nef} -> {out_path}")
+				except Exception as e:  # keep going on errors
+					failed += 1
+					print(f"[{ok + failed}] ERROR: failed to convert {nef}: {e}")
+
+	if ok + failed == 0:
 		print("No NEF images found. Nothing to do.")
 		if is_frozen():
 			input("Press Enter to close...")
 		return 0
 
-	total = len(nef_files)
-	print(f"Found {total} NEF file(s). Converting to: {results_dir}")
-
-	ok = 0
-	failed = 0
-	for idx, nef in enumerate(nef_files, start=1):
-		try:
-			rel = nef.parent.relative_to(base_dir)
-			out_dir = results_dir / rel
-			out_path = out_dir / (nef.stem + ".jpg")
-			print(f"[{idx}/{total}] {nef} -> {out_path}")
-			convert_nef_to_jpg(nef, out_path, quality=args.quality, mode=args.mode, verbose=args.verbose)
-			ok += 1
-		except Exception as e:  # keep going on errors
-			failed += 1
-			print(f"ERROR: failed to convert {nef}: {e}")
-
 	print(f"Done. Converted: {ok}, Failed: {failed}. Output in: {results_dir}")
 	if is_frozen():
 		input("Press Enter to close...")
@@ -265,5 +497,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+	# Required for the process pool in the frozen EXE on Windows
+	multiprocessing.freeze_support()
 	raise SystemExit(main())
 
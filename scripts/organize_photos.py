@@ -18,7 +18,8 @@ results/
 │   └── ...
 
 Dependencies:
-- Pillow (PIL) for EXIF data reading
+- exifread for EXIF date reading (optional, fastest)
+- Pillow (PIL) for EXIF data reading when exifread is missing or can't parse the file
 - shutil for file copying
 
 Notes:
@@ -31,16 +32,21 @@ from __future__ import annotations
 
 import sys
 import os
+import io
+import logging
 import shutil
+import struct
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 # Common image extensions
-IMAGE_EXTENSIONS = {
+IMAGE_EXTENSIONS = frozenset({
     '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp',
     '.nef', '.cr2', '.arw', '.dng', '.raf', '.orf', '.rw2', '.pef', '.srw'
-}
+})
 
 
 def is_frozen() -> bool:
@@ -54,70 +60,229 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
-def iter_image_files(root: Path) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Skip the results folder itself if it already exists
-        if Path(dirpath) == (root / "results"):
+def iter_image_files(root: Path) -> Iterable[Tuple[Path, Optional[os.stat_result]]]:
+    """Yield (path, stat result) for every image under root.
+
+    The stat comes from the scandir entry (on Windows, from the listing
+    itself) and is reused for the copy's timestamps; None if it failed.
+    """
+    results_dir = str(root / "results")
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip the results folder itself if it already exists
+                        if entry.path != results_dir and not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        # Suffix sliced by hand (dotfiles have none); only matches become Paths
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot > 0 and name[dot:].lower() in IMAGE_EXTENSIONS:
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                st = None
+                            yield Path(entry.path), st
+        except OSError:
             continue
-        for name in filenames:
-            if Path(name).suffix.lower() in IMAGE_EXTENSIONS:
-                yield Path(dirpath) / name
 
 
-def get_image_date(image_path: Path) -> datetime:
-    """Extract date from EXIF data, fall back to file modification date."""
+# EXIF date tags in order of preference, as exifread names them
+EXIF_DATE_TAGS = ("EXIF DateTimeOriginal", "EXIF DateTimeDigitized", "Image DateTime")
+
+# How much of a file to hand to exifread first; RAW formats keep their
+# TIFF IFDs further in than JPEGs keep their APP1 segment
+EXIF_READ_LIMIT = 128 * 1024
+RAW_EXIF_READ_LIMIT = 1024 * 1024
+RAW_EXTENSIONS = {'.nef', '.cr2', '.arw', '.dng', '.raf', '.orf', '.rw2', '.pef', '.srw'}
+
+
+def _parse_exif_date(value) -> Optional[datetime]:
+    try:
+        return datetime.strptime(str(value).strip(), '%Y:%m:%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return None
+
+
+# TIFF tag IDs for the EXIF date fields, in order of preference: (IFD, tag)
+_EXIF_IFD_POINTER = 0x8769
+# DateTime (last) is the file's modification time, not the capture time
+_TIFF_DATE_TAGS = (("exif", 0x9003), ("exif", 0x9004), ("ifd0", 0x0132))
+
+
+def _ifd_entries(tiff: bytes, order: str, offset: int) -> Dict[int, Tuple[int, int, int]]:
+    """Return {tag: (type, count, value_or_offset)} for the IFD at offset."""
+    count = struct.unpack_from(order + "H", tiff, offset)[0]
+    entries = {}
+    for n in range(count):
+        tag, typ, cnt, value = struct.unpack_from(order + "HHII", tiff, offset + 2 + n * 12)
+        entries[tag] = (typ, cnt, value)
+    return entries
+
+
+def _jpeg_app1_datetime(buf: bytes) -> Optional[datetime]:
+    """Read the EXIF date straight out of a JPEG's APP1 segment.
+
+    Walks the JPEG markers up to APP1, then IFD0 -> Exif IFD, decoding only
+    the three date entries instead of the whole EXIF block.
+    """
+    if not buf.startswith(b"\xff\xd8"):
+        return None
+    pos = 2
+    tiff = None
+    while pos + 4 <= len(buf) and buf[pos] == 0xFF:
+        marker = buf[pos + 1]
+        if marker in (0xD9, 0xDA):  # end of image / start of scan: no more metadata
+            return None
+        length = struct.unpack_from(">H", buf, pos + 2)[0]
+        if marker == 0xE1 and buf[pos + 4:pos + 10] == b"Exif\x00\x00":
+            tiff = buf[pos + 10:pos + 2 + length]
+            break
+        pos += 2 + length
+    if not tiff:
+        return None
+    
+    order = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if order is None:
+        return None
     try:
-        from PIL import Image
-        from PIL.ExifTags import TAGS
+        ifds = {"ifd0": _ifd_entries(tiff, order, struct.unpack_from(order + "I", tiff, 4)[0])}
+        pointer = ifds["ifd0"].get(_EXIF_IFD_POINTER)
+        ifds["exif"] = _ifd_entries(tiff, order, pointer[2]) if pointer else {}
+    except struct.error:
+        return None
+    for ifd, tag in _TIFF_DATE_TAGS:
+        entry = ifds[ifd].get(tag)
+        if entry and entry[0] == 2 and entry[1] > 4:  # ASCII, stored at an offset
+            raw = tiff[entry[2]:entry[2] + entry[1]].rstrip(b"\x00")
+            parsed = _parse_exif_date(raw.decode("ascii", "replace"))
+            if parsed:
+                return parsed
+    return None
+
+
+def _jpeg_date(image_path: Path) -> Optional[datetime]:
+    if image_path.suffix.lower() not in ('.jpg', '.jpeg'):
+        return None
+    with open(image_path, 'rb') as f:
+        return _jpeg_app1_datetime(f.read(EXIF_READ_LIMIT))
+
+
+def _exifread_tags_date(f) -> Optional[datetime]:
+    import exifread  # type: ignore
+
+    # exifread logs a warning for every file without EXIF (PNG, GIF, ...)
+    logging.getLogger("exifread").setLevel(logging.ERROR)
+    # details=False skips maker notes and thumbnails
+    tags = exifread.process_file(f, stop_tag="DateTimeOriginal", details=False)
+    for name in EXIF_DATE_TAGS:
+        if name in tags:
+            parsed = _parse_exif_date(tags[name])
+            if parsed:
+                return parsed
+    return None
+
+
+def _exifread_date(image_path: Path) -> Optional[datetime]:
+    """Read the date with exifread, stopping as soon as DateTimeOriginal is parsed.
+
+    Only the start of the file is read at first, since that is where EXIF lives;
+    the whole file is parsed only if the date isn't found there.
+    """
+    limit = RAW_EXIF_READ_LIMIT if image_path.suffix.lower() in RAW_EXTENSIONS else EXIF_READ_LIMIT
+    with open(image_path, 'rb') as f:
+        header = f.read(limit)
+        try:
+            found = _exifread_tags_date(io.BytesIO(header))
+        except Exception:
+            found = None
+        if found is None and len(header) == limit:
+            f.seek(0)
+            found = _exifread_tags_date(f)
+    return found
+
+
+def _pillow_date(image_path: Path) -> Optional[datetime]:
+    from PIL import Image
+    
+    with Image.open(image_path) as img:
+        exif_data = img.getexif()
         
-        with Image.open(image_path) as img:
-            exif_data = img.getexif()
-            
-            if exif_data:
-                # Try different EXIF date fields
-                for tag_id, value in exif_data.items():
-                    tag = TAGS.get(tag_id, tag_id)
-                    if tag in ('DateTime', 'DateTimeOriginal', 'DateTimeDigitized'):
-                        try:
-                            return datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-                        except (ValueError, TypeError):
-                            continue
-    except Exception:
-        pass
+        if exif_data:
+            # Look the date tags up by their fixed IDs instead of naming every tag
+            ifds = {"ifd0": exif_data, "exif": exif_data.get_ifd(_EXIF_IFD_POINTER)}
+            for ifd, tag in _TIFF_DATE_TAGS:
+                parsed = _parse_exif_date(ifds[ifd].get(tag))
+                if parsed:
+                    return parsed
+    return None
+
+
+def get_image_date(image_path: Path, st: Optional[os.stat_result] = None) -> datetime:
+    """Extract date from EXIF data, fall back to file modification date."""
+    # JPEGs: read the date entries directly; exifread reads just the EXIF
+    # header of everything else; Pillow covers what it can't parse (e.g. WebP)
+    for reader in (_jpeg_date, _exifread_date, _pillow_date):
+        try:
+            found = reader(image_path)
+        except Exception:
+            continue
+        if found:
+            return found
     
     # Fall back to file modification time
-    return datetime.fromtimestamp(image_path.stat().st_mtime)
+    return datetime.fromtimestamp((st or image_path.stat()).st_mtime)
+
+
+MONTH_NAMES = (
+    "01-January", "02-February", "03-March", "04-April",
+    "05-May", "06-June", "07-July", "08-August",
+    "09-September", "10-October", "11-November", "12-December"
+)
 
 
 def get_month_name(month: int) -> str:
     """Convert month number to formatted string with name."""
-    months = [
-        "01-January", "02-February", "03-March", "04-April",
-        "05-May", "06-June", "07-July", "08-August",
-        "09-September", "10-October", "11-November", "12-December"
-    ]
-    return months[month - 1]
+    return MONTH_NAMES[month - 1]
+
+
+# Destination names already handed out; photos are copied by several threads
+_RESERVED_PATHS: Set[Path] = set()
+_RESERVE_LOCK = threading.Lock()
 
 
 def unique_path(path: Path) -> Path:
-    """Generate a unique path if file already exists by adding numeric suffix."""
-    if not path.exists():
-        return path
-    
+    """Generate a unique path if file already exists by adding numeric suffix.
+
+    Thread-safe: a name is reserved when returned, so two workers never pick
+    the same destination before either has copied its file there.
+    """
     base = path.with_suffix("")
     suffix = path.suffix
-    i = 1
-    while True:
-        cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
-        if not cand.exists():
-            return cand
-        i += 1
+    with _RESERVE_LOCK:
+        cand = path
+        i = 1
+        while cand in _RESERVED_PATHS or cand.exists():
+            cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
+            i += 1
+        _RESERVED_PATHS.add(cand)
+        return cand
 
 
-def organize_photo(image_path: Path, results_dir: Path) -> None:
-    """Copy image to organized folder structure based on its date."""
+def organize_photo(image_path: Path, results_dir: Path,
+                   st: Optional[os.stat_result] = None) -> Tuple[Path, datetime]:
+    """Copy image to organized folder structure based on its date.
+
+    st is the image's stat result from the scan, if there is one.
+    Returns the destination path and the date the photo was filed under.
+    """
     try:
-        img_date = get_image_date(image_path)
+        if st is None:
+            st = image_path.stat()
+        img_date = get_image_date(image_path, st)
         year = img_date.year
         month = img_date.month
         
@@ -129,8 +294,11 @@ def organize_photo(image_path: Path, results_dir: Path) -> None:
         dest_path = month_folder / image_path.name
         dest_path = unique_path(dest_path)
         
-        shutil.copy2(image_path, dest_path)
-        return dest_path
+        # Only the timestamps are worth keeping; copy2's copystat would also
+        # chase permission bits, flags and xattrs with extra syscalls
+        shutil.copyfile(image_path, dest_path)
+        os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return dest_path, img_date
         
     except Exception as e:
         raise Exception(f"Failed to organize {image_path}: {e}")
@@ -156,15 +324,22 @@ def main() -> int:
     organized = 0
     failed = 0
     
-    for idx, img_path in enumerate(image_files, start=1):
-        try:
-            dest_path = organize_photo(img_path, results_dir)
-            img_date = get_image_date(img_path)
-            print(f"[{idx}/{total}] {img_path.name} ({img_date.strftime('%Y-%m-%d')}) -> {dest_path.relative_to(results_dir)}")
-            organized += 1
-        except Exception as e:
-            failed += 1
-            print(f"ERROR: {e}")
+    # EXIF reads and copies wait on the disk, so threads overlap them despite the GIL.
+    # The year/month folders depend on each photo's date; mkdir(exist_ok=True)
+    # in organize_photo is safe to race.
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(organize_photo, img_path, results_dir, st): img_path
+                   for img_path, st in image_files}
+        for idx, future in enumerate(as_completed(futures), start=1):
+            img_path = futures[future]
+            try:
+                dest_path, img_date = future.result()
+                print(f"[{idx}/{total}] {img_path.name} ({img_date.strftime('%Y-%m-%d')}) -> {dest_path.relative_to(results_dir)}")
+                organized += 1
+            except Exception as e:
+                failed += 1
+                print(f"ERROR: {e}")
 
     print(f"\nDone! Organized: {organized}, Failed: {failed}")
     print(f"Photos organized in: {results_dir}")
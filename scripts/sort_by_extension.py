@@ -33,17 +33,23 @@ Notes:
 - Handles duplicate filenames by adding numeric suffixes.
 - Creates organized folder structure by file extension.
 - Files without extensions go to "no_extension" folder.
+- --aggregate packs each extension into one "sorted_files/<ext>.tar" instead,
+  which is much faster for folders with many small files.
 """
 
 from __future__ import annotations
 
 import sys
 import os
+import argparse
+import errno
 import shutil
+import tarfile
 from pathlib import Path
 from datetime import datetime
-from typing import Iterable, Dict, Set
+from typing import Iterable, Dict, List, Set, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Constants
@@ -61,48 +67,61 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
-def iter_all_files(root: Path, exclude_dirs: Set[str] = None) -> Iterable[Path]:
-    """Iterate through all files in the directory tree, excluding specified directories."""
+def iter_all_files(root: Path, exclude_dirs: Set[str] = None) -> Iterable[os.DirEntry]:
+    """Iterate through all files in the directory tree, excluding specified directories.
+
+    Yields os.DirEntry objects: their name and cached stat() spare a Path
+    and a stat call per file later on.
+    """
     if exclude_dirs is None:
         exclude_dirs = set()
     
-    for dirpath, dirnames, filenames in os.walk(root):
-        dir_path = Path(dirpath)
-        
-        # Skip excluded directories
-        if any(exclude_dir in dir_path.parts for exclude_dir in exclude_dirs):
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip excluded directories; like os.walk, don't follow symlinked ones
+                        if entry.name not in exclude_dirs and not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
             continue
-            
-        for filename in filenames:
-            file_path = dir_path / filename
-            yield file_path
 
 
-def get_file_extension(file_path: Path) -> str:
-    """Get file extension in lowercase, or 'no_extension' if none."""
-    ext = file_path.suffix.lower()
-    if ext:
-        return ext[1:]  # Remove the leading dot
+def get_file_extension(name: str) -> str:
+    """Get a file name's extension in lowercase, or 'no_extension' if none."""
+    stem, dot, ext = name.rpartition('.')
+    if stem and ext:  # same rules as Path.suffix: ".bashrc" and "name." have none
+        return ext.lower()
     return "no_extension"
 
 
 def unique_path(path: Path) -> Path:
-    """Generate a unique path if file already exists by adding numeric suffix."""
-    if not path.exists():
-        return path
-    
+    """Generate a unique path if file already exists by adding numeric suffix.
+
+    The name is claimed by creating an empty placeholder with O_EXCL, so the
+    existence check and the reservation are one atomic syscall and two
+    workers can never pick the same destination. Callers overwrite the
+    placeholder (or remove it if they fail).
+    """
     base = path.with_suffix("")
     suffix = path.suffix
+    cand = path
     i = 1
     while True:
-        cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
-        if not cand.exists():
+        try:
+            os.close(os.open(cand, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
             return cand
-        i += 1
+        except FileExistsError:
+            cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
+            i += 1
 
 
-def get_file_size_mb(path: Path) -> float:
-    """Get file size in MB."""
+def get_file_size_mb(path) -> float:
+    """Get file size in MB of a Path or (cached stat) os.DirEntry."""
     try:
         return path.stat().st_size / (1024 * 1024)
     except OSError:
@@ -110,20 +129,75 @@ def get_file_size_mb(path: Path) -> float:
 
 
 def sort_file_by_extension(file_path: Path, sorted_dir: Path) -> Path:
-    """Move file to extension-based subfolder, preserving relative structure if needed."""
-    extension = get_file_extension(file_path)
-    # Create extension subfolder
+    """Move file to extension-based subfolder, preserving relative structure if needed.
+
+    The extension subfolder must already exist (main() creates them up front).
+    """
+    extension = get_file_extension(file_path.name)
     ext_folder = sorted_dir / extension
-    ext_folder.mkdir(parents=True, exist_ok=True)
     # Using flattened approach for simplicity
     dest_path = ext_folder / file_path.name
     dest_path = unique_path(dest_path)
-    # Move the file
-    shutil.move(str(file_path), str(dest_path))
+    # Move the file over its placeholder; a rename is one syscall when on the same drive
+    try:
+        try:
+            os.replace(file_path, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copy2(file_path, dest_path)
+            os.unlink(file_path)
+    except Exception:
+        os.unlink(dest_path)
+        raise
     return dest_path
 
 
+def archive_extension(extension: str, entries: List[os.DirEntry], sorted_dir: Path) -> Tuple[Path, int, List[Tuple[str, Exception]]]:
+    """Pack every file of one extension into sorted_dir/<extension>.tar (--aggregate).
+
+    The archive is written sequentially in one stream instead of creating a
+    directory entry per file. If any file can't be added (a read error can
+    strike after its header is already written, leaving the rest of the
+    archive misaligned), the partial archive is deleted and every original
+    is kept; the error is raised. Originals are deleted only after the
+    archive has been closed successfully. Returns the archive path, the
+    number of files moved into it and the (name, error) pairs of archived
+    files whose original could not be removed.
+    """
+    tar_path = unique_path(sorted_dir / f"{extension}.tar")
+    used_names: Set[str] = set()
+    try:
+        with open(tar_path, 'wb', buffering=1 << 20) as f, tarfile.open(fileobj=f, mode='w') as tar:
+            for entry in entries:
+                # Same-named files from different folders get numeric suffixes
+                stem, suffix = os.path.splitext(entry.name)
+                arcname = entry.name
+                i = 1
+                while arcname in used_names:
+                    arcname = f"{stem}_{i}{suffix}"
+                    i += 1
+                tar.add(entry.path, arcname=arcname, recursive=False)
+                used_names.add(arcname)
+    except BaseException:
+        os.unlink(tar_path)
+        raise
+    
+    errors = []
+    for entry in entries:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            errors.append((entry.name, e))
+    return tar_path, len(entries) - len(errors), errors
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Sort files into subfolders by extension")
+    parser.add_argument('--aggregate', action='store_true',
+                        help='Pack each extension into one sorted_files/<ext>.tar instead of moving files one by one')
+    args = parser.parse_args()
+    
     base_dir = get_base_dir()
     sorted_dir = base_dir / "sorted_files"
     sorted_dir.mkdir(exist_ok=True)
@@ -158,9 +232,16 @@ def main() -> int:
     
     print(f"Excluding directories: {', '.join(sorted(exclude_dirs))}")
     
-    # Scan for files
+    # Scan for files, grouping them by extension and totalling sizes in the same pass
     print("\n🔍 Scanning for files...")
-    all_files = list(iter_all_files(base_dir, exclude_dirs))
+    all_files = []
+    files_by_ext = defaultdict(list)
+    total_size = 0
+    
+    for entry in iter_all_files(base_dir, exclude_dirs):
+        all_files.append(entry)
+        files_by_ext[get_file_extension(entry.name)].append(entry)
+        total_size += get_file_size_mb(entry)
     
     if not all_files:
         print("No files found to sort.")
@@ -168,15 +249,6 @@ def main() -> int:
             input(CLOSE_PROMPT)
         return 0
 
-    # Group files by extension for reporting
-    files_by_ext = defaultdict(list)
-    total_size = 0
-    
-    for file_path in all_files:
-        extension = get_file_extension(file_path)
-        files_by_ext[extension].append(file_path)
-        total_size += get_file_size_mb(file_path)
-
     # Show summary
     total_files = len(all_files)
     total_extensions = len(files_by_ext)
@@ -210,18 +282,59 @@ def main() -> int:
     sorted_count = 0
     failed_count = 0
     
-    for idx, file_path in enumerate(all_files, start=1):
-        try:
-            if idx % 50 == 0 or idx == total_files:
-                print(f"  Progress: {idx}/{total_files} files processed", end='\r')
-            
-            sort_file_by_extension(file_path, sorted_dir)
-            sorted_count += 1
-            
-        except Exception as e:
-            failed_count += 1
-            if failed_count <= 5:  # Show first few errors
-                print(f"\n  ❌ Error sorting {file_path.name}: {e}")
+    # Moves are syscall/disk bound, so threads overlap them despite the GIL
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    if args.aggregate:
+        # One tarball per extension, written by one worker each
+        with ThreadPoolExecutor(max_workers=min(workers, len(files_by_ext))) as executor:
+            futures = {executor.submit(archive_extension, ext, entries, sorted_dir): ext
+                       for ext, entries in files_by_ext.items()}
+            for future in as_completed(futures):
+                ext = futures[future]
+                try:
+                    tar_path, archived, errors = future.result()
+                except Exception as e:
+                    failed_count += len(files_by_ext[ext])
+                    print(f"  ❌ Error archiving .{ext} files (originals kept): {e}")
+                    continue
+                sorted_count += archived
+                failed_count += len(errors)
+                print(f"  📦 {tar_path.name}: {archived} files")
+                for name, e in errors[:5]:
+                    print(f"  ❌ Archived {name} but could not remove the original: {e}")
+        
+        print("\n✅ Archiving complete!")
+        print(f"   Files archived: {sorted_count}")
+        print(f"   Failed: {failed_count}")
+        print(f"\n📂 Archives location: {sorted_dir}")
+        
+        if is_frozen():
+            print("\n" + "="*60)
+            input(CLOSE_PROMPT)
+        
+        return 0 if failed_count == 0 else 1
+    
+    # Create every extension folder before the workers start moving files
+    for extension in files_by_ext:
+        (sorted_dir / extension).mkdir(exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(sort_file_by_extension, Path(entry.path), sorted_dir): entry
+                   for entry in all_files}
+        for idx, future in enumerate(as_completed(futures), start=1):
+            entry = futures[future]
+            try:
+                if idx % 50 == 0 or idx == total_files:
+                    print(f"  Progress: {idx}/{total_files} files processed", end='\r')
+                
+                future.result()
+                sorted_count += 1
+                
+            except Exception as e:
+                failed_count += 1
+                if failed_count <= 5:  # Show first few errors
+                    print(f"\n  ❌ Error sorting {entry.name}: {e}")
 
     print("\n\n✅ Sorting complete!")
     print(f"   Files sorted: {sorted_count}")
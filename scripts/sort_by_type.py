@@ -56,19 +56,35 @@ from __future__ import annotations
 
 import sys
 import os
+import argparse
+import errno
 import shutil
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Iterable, Dict, Set
+from typing import Iterable, Dict, List, Optional, Set, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Constants
 CLOSE_PROMPT = "Press Enter to close..."
 
+# Copies and moves wait on the disk, not the CPU, so use more threads than cores
+DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+# Progress line is redrawn every PROGRESS_EVERY files or PROGRESS_INTERVAL seconds
+PROGRESS_EVERY = 200
+PROGRESS_INTERVAL = 0.25
+
+# Directory listings scanned at once; enough to hide network share latency
+SCAN_WORKERS = 4
+
 # File type categories mapping
 FILE_TYPE_CATEGORIES = {
-    "Documents": {
+    "Documents": frozenset({
         "pdf", "doc", "docx", "txt", "rtf", "odt", "ods", "odp",
         "ppt", "pptx", "pps", "ppsx", "xls", "xlsx", "xlsm", "csv",
         "epub", "mobi", "azw", "azw3", "fb2", "lit", "lrf", "pdb",
@@ -76,18 +92,18 @@ FILE_TYPE_CATEGORIES = {
         "rst", "asciidoc", "adoc", "pages", "numbers", "key",
         "wps", "wpt", "dif", "slk", "prn", "ots", "fods", "uos",
         "sxw", "stw", "sxc", "stc", "sxi", "sti", "sxd", "std"
-    },
+    }),
     
-    "Images": {
+    "Images": frozenset({
         "jpg", "jpeg", "png", "gif", "bmp", "tiff", "tif", "svg",
         "webp", "ico", "cur", "ani", "psd", "ai", "eps", "raw",
         "nef", "cr2", "cr3", "arw", "dng", "orf", "rw2", "pef", "srw",
         "heic", "heif", "avif", "jxl", "jp2", "j2k", "jpf", "jpx",
         "jpm", "mj2", "exr", "hdr", "pic", "pct", "sgi", "tga",
         "pcx", "ppm", "pgm", "pbm", "pnm", "xbm", "xpm", "dds"
-    },
+    }),
     
-    "Media": {
+    "Media": frozenset({
         # Video formats
         "mp4", "avi", "mkv", "mov", "wmv", "flv", "webm", "m4v",
         "3gp", "3g2", "asf", "rm", "rmvb", "vob", "ogv", "dv",
@@ -97,27 +113,27 @@ FILE_TYPE_CATEGORIES = {
         "mp3", "wav", "flac", "aac", "ogg", "wma", "m4a", "opus",
         "ape", "alac", "aiff", "au", "ra", "amr", "ac3", "dts",
         "tta", "wv", "tak", "spx", "gsm", "voc", "snd", "caf"
-    },
+    }),
     
-    "Executables": {
+    "Executables": frozenset({
         "exe", "msi", "msp", "msu", "app", "dmg", "pkg", "deb",
         "rpm", "snap", "flatpak", "appimage", "run", "bin", "com",
         "bat", "cmd", "sh", "bash", "zsh", "fish", "ps1", "psm1",
         "vbs", "vbe", "js", "jse", "wsf", "wsh", "scr", "pif",
         "gadget", "inf", "ins", "isp", "job", "lnk", "msc",
         "reg", "rgs", "scf", "sct", "shb", "shs", "u3p", "vb"
-    },
+    }),
     
-    "Archives": {
+    "Archives": frozenset({
         "zip", "rar", "7z", "tar", "gz", "bz2", "xz", "lzma",
         "z", "lz", "lz4", "zst", "br", "ar", "cpio", "shar",
         "iso", "img", "dmg", "toast", "vcd", "cab", "msi",
         "ace", "arj", "arc", "pak", "pk3", "pk4", "war", "ear",
         "sar", "apk", "ipa", "deb", "rpm", "xpi", "crx",
         "egg", "whl", "gem", "nupkg", "vsix", "oxt"
-    },
+    }),
     
-    "Code": {
+    "Code": frozenset({
         "py", "pyw", "pyc", "pyo", "pyd", "js", "jsx", "ts", "tsx",
         "html", "htm", "css", "scss", "sass", "less", "xml", "json",
         "yaml", "yml", "toml", "ini", "cfg", "conf", "config",
@@ -132,7 +148,7 @@ FILE_TYPE_CATEGORIES = {
         "exs", "eex", "heex", "dart", "pas", "pp", "inc", "asm",
         "s", "nasm", "yasm", "f", "f90", "f95", "f03", "f08",
         "for", "ftn", "fpp", "jl", "nb", "wl", "m", "mata"
-    }
+    })
 }
 
 # Create reverse mapping for faster lookup
@@ -140,6 +156,15 @@ EXTENSION_TO_CATEGORY = {}
 for category, extensions in FILE_TYPE_CATEGORIES.items():
     for ext in extensions:
         EXTENSION_TO_CATEGORY[ext] = category
+# Interned keys and values: lookups hit the identity fast path, and every
+# files_by_category key is the same string object as the category name
+EXTENSION_TO_CATEGORY = {sys.intern(ext): sys.intern(category) for ext, category in EXTENSION_TO_CATEGORY.items()}
+
+# Small integer ids per category, so the scan can count into plain lists
+CATEGORY_NAMES = (*FILE_TYPE_CATEGORIES, "Others")
+CATEGORY_IDS = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+OTHERS_ID = CATEGORY_IDS["Others"]
+EXT_TO_ID = {ext: CATEGORY_IDS[category] for ext, category in EXTENSION_TO_CATEGORY.items()}
 
 
 def is_frozen() -> bool:
@@ -153,78 +178,234 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
-def iter_all_files(root: Path, exclude_dirs: Set[str] = None) -> Iterable[Path]:
-    """Iterate through all files in the directory tree, excluding specified directories."""
+def parallel_walk(root: Path, exclude_dirs: Set[str] = None, workers: int = SCAN_WORKERS) -> Iterable[Tuple[str, int, int]]:
+    """Walk root with several threads listing directories at once.
+
+    On network shares (SMB/NFS) each scandir waits on a round trip, so
+    listing a few folders concurrently hides most of that latency. Results
+    arrive one directory's worth at a time, in no particular order, as
+    (path, size, category id) tuples: the category is taken from the bare
+    entry name while it is at hand, instead of re-parsing the full path.
+    """
     if exclude_dirs is None:
         exclude_dirs = set()
+    excluded = exclude_dirs.__contains__
     
-    for dirpath, dirnames, filenames in os.walk(root):
-        dir_path = Path(dirpath)
-        
-        # Skip excluded directories
-        if any(exclude_dir in dir_path.parts for exclude_dir in exclude_dirs):
-            continue
-            
-        for filename in filenames:
-            file_path = dir_path / filename
-            yield file_path
-
-
-def get_file_category(file_path: Path) -> str:
-    """Get file category based on extension."""
-    ext = file_path.suffix.lower()
-    if ext:
-        ext = ext[1:]  # Remove the leading dot
-        return EXTENSION_TO_CATEGORY.get(ext, "Others")
-    return "Others"
-
-
-def unique_path(path: Path) -> Path:
-    """Generate a unique path if file already exists by adding numeric suffix."""
-    if not path.exists():
-        return path
+    dir_queue: queue.Queue[Optional[str]] = queue.Queue()
+    results: queue.Queue[Optional[List[Tuple[str, int, int]]]] = queue.Queue()
     
-    base = path.with_suffix("")
-    suffix = path.suffix
+    def scan() -> None:
+        while True:
+            folder = dir_queue.get()
+            if folder is None:
+                return
+            batch = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Skip excluded directories; like os.walk, don't follow symlinked ones
+                            if not excluded(entry.name) and not entry.is_symlink():
+                                dir_queue.put(entry.path)
+                        else:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                size = 0
+                            batch.append((entry.path, size, name_category_id(entry.name)))
+            except OSError:
+                pass
+            if batch:
+                results.put(batch)
+            dir_queue.task_done()
+    
+    def finish() -> None:
+        # Every queued folder has been scanned (subfolders are queued before
+        # their parent is marked done), so stop the scanners and the consumer
+        dir_queue.join()
+        for _ in range(workers):
+            dir_queue.put(None)
+        results.put(None)
+    
+    dir_queue.put(str(root))
+    for _ in range(workers):
+        threading.Thread(target=scan, daemon=True).start()
+    threading.Thread(target=finish, daemon=True).start()
+    
+    while True:
+        batch = results.get()
+        if batch is None:
+            return
+        yield from batch
+
+
+_CATEGORY_ID_OF = EXT_TO_ID.get
+
+
+def name_category_id(name: str) -> int:
+    """Index into CATEGORY_NAMES of a file name's category, based on its extension."""
+    head, dot, ext = name.rpartition('.')
+    if not head:  # no dot, or a dotfile like ".bashrc"
+        return OTHERS_ID
+    return _CATEGORY_ID_OF(ext.lower(), OTHERS_ID)
+
+
+def unique_path(path: str) -> str:
+    """Generate a unique path if file already exists by adding numeric suffix.
+
+    The name is claimed by creating an empty placeholder with O_EXCL, so
+    concurrent workers can never pick the same destination. Callers
+    overwrite the placeholder (or remove it if they fail).
+    """
+    root, ext = os.path.splitext(path)
+    cand = path
     i = 1
     while True:
-        cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
-        if not cand.exists():
+        try:
+            os.close(os.open(cand, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
             return cand
-        i += 1
+        except FileExistsError:
+            cand = f"{root}_{i}{ext}"
+            i += 1
+
+
+# Errors meaning copy_file_range or sendfile can't handle this pair of files
+# (other filesystem, old kernel, special file), so the next method is tried
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF}
+COPY_CHUNK = 1024 * 1024
+# Big media files copy faster in larger chunks
+LARGE_COPY_CHUNK = 4 * 1024 * 1024
+LARGE_FILE_BYTES = 256 * 1024 * 1024
+
+
+# One copy buffer per worker thread, reused for every file it copies by hand
+_TLS = threading.local()
+
+
+def _copy_buffer(size: int) -> memoryview:
+    """Return a view of this thread's copy buffer, growing it if needed."""
+    buf = getattr(_TLS, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = _TLS.buf = bytearray(size)
+    return memoryview(buf)[:size]
 
 
-def get_file_size_mb(path: Path) -> float:
-    """Get file size in MB."""
+def _rewind(fsrc, fdst) -> None:
+    """Undo a partial in-kernel copy so the next method starts from byte 0."""
+    fsrc.seek(0)
+    fdst.seek(0)
+    fdst.truncate()
+
+
+def _copy_bytes(fsrc, fdst) -> None:
+    """Copy an open file's data in-kernel, falling back step by step."""
+    fd_in, fd_out = fsrc.fileno(), fdst.fileno()
+    size = os.fstat(fd_in).st_size
+    copied = 0
     try:
-        return path.stat().st_size / (1024 * 1024)
-    except OSError:
-        return 0.0
-
-
-def copy_file_by_type(file_path: Path, sorted_dir: Path) -> Path:
-    """Copy file to type-based subfolder (default)."""
-    return move_or_copy_file_by_type(file_path, sorted_dir, move=False)
-
-def move_file_by_type(file_path: Path, sorted_dir: Path) -> Path:
-    """Move file to type-based subfolder."""
-    return move_or_copy_file_by_type(file_path, sorted_dir, move=True)
-
-def move_or_copy_file_by_type(file_path: Path, sorted_dir: Path, move: bool = False) -> Path:
-    """Move or copy file to type-based subfolder based on the 'move' flag."""
-    category = get_file_category(file_path)
-    category_folder = sorted_dir / category
-    category_folder.mkdir(parents=True, exist_ok=True)
-    dest_path = category_folder / file_path.name
-    dest_path = unique_path(dest_path)
-    if move:
-        shutil.move(str(file_path), str(dest_path))
+        while True:
+            n = os.copy_file_range(fd_in, fd_out, 1 << 30)
+            if not n:
+                break
+            copied += n
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_UNSUPPORTED:
+            raise
     else:
-        shutil.copy2(str(file_path), str(dest_path))
+        # Some filesystems report 0 (EOF) instead of refusing the copy
+        if copied >= size:
+            return
+    _rewind(fsrc, fdst)
+    
+    # Ask for aggressive readahead so reads rarely wait on the disk
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd_in, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    large = size > LARGE_FILE_BYTES
+    chunk = LARGE_COPY_CHUNK if large else COPY_CHUNK
+    
+    # sendfile works across filesystems, which older kernels' copy_file_range doesn't
+    offset = 0
+    try:
+        while True:
+            sent = os.sendfile(fd_out, fd_in, offset, chunk)
+            if not sent:
+                return
+            offset += sent
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_UNSUPPORTED:
+            raise
+        _rewind(fsrc, fdst)
+    
+    # Last resort: a plain read loop into this thread's reused buffer
+    view = _copy_buffer(chunk)
+    while True:
+        n = fsrc.readinto(view)
+        if not n:
+            break
+        # Unbuffered writes may be partial
+        done = 0
+        while done < n:
+            done += fdst.write(view[done:n])
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy src to dst with its metadata, like shutil.copy2.
+
+    On Linux the data is moved in-kernel with os.copy_file_range, which also
+    lets CoW and network filesystems clone or copy server-side; if that is
+    refused, os.sendfile still copies without passing through Python. Windows and
+    macOS use shutil.copy2's native copy (CopyFile2, fcopyfile); other systems a
+    1 MiB read/write loop.
+    """
+    if not hasattr(os, "copy_file_range"):
+        if os.name == "nt" or sys.platform == "darwin":
+            shutil.copy2(src, dst)
+        else:
+            # shutil's own read/write loop would use 64 KiB chunks
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+            shutil.copystat(src, dst)
+        return
+    
+    # Unbuffered: data goes straight between the kernel and the copy buffer
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        _copy_bytes(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _copy_to_prepared(file_path: str, dest_dir: str, move: bool = False, same_device: bool = True) -> str:
+    """Move or copy file into dest_dir, which must already exist.
+
+    same_device=False says the output folder is known to be on another
+    drive, so moves skip the rename attempt that would only fail with EXDEV.
+    """
+    dest_path = unique_path(os.path.join(dest_dir, os.path.basename(file_path)))
+    try:
+        if move:
+            # Replace the placeholder; a rename is one syscall and keeps all metadata
+            try:
+                if not same_device:
+                    raise OSError(errno.EXDEV, "output folder is on another drive")
+                os.replace(file_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                _fast_copy(file_path, dest_path)
+                os.unlink(file_path)
+        else:
+            _fast_copy(file_path, dest_path)
+    except Exception:
+        os.unlink(dest_path)
+        raise
     return dest_path
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Sort files into subfolders by file type")
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Files copied/moved at the same time (default: {DEFAULT_CONCURRENCY})')
+    args = parser.parse_args()
+    
     base_dir = get_base_dir()
     sorted_dir = base_dir / "sorted_by_type"
     sorted_dir.mkdir(exist_ok=True)
@@ -267,27 +448,35 @@ def main() -> int:
 
     print(f"\n🚫 Excluding directories: {', '.join(sorted(exclude_dirs))}")
 
-    # Scan for files
+    # Scan for files, grouping them by category with their sizes in the same pass
     print("\n🔍 Scanning for files...")
-    all_files = list(iter_all_files(base_dir, exclude_dirs))
-
-    if not all_files:
+    # Per-file work is an index into lists; dicts are built per category afterwards
+    paths_by_id: List[List[Tuple[str, int]]] = [[] for _ in CATEGORY_NAMES]
+    bytes_by_id = [0] * len(CATEGORY_NAMES)
+    # Bound appends skip an index and an attribute lookup per file
+    appends = [files.append for files in paths_by_id]
+
+    for file_path, size, category_id in parallel_walk(base_dir, exclude_dirs):
+        appends[category_id]((file_path, size))
+        bytes_by_id[category_id] += size
+
+    files_by_category: Dict[str, List[Tuple[str, int]]] = {}
+    category_totals: Dict[str, int] = {}
+    for category_id, files in enumerate(paths_by_id):
+        if files:
+            files_by_category[CATEGORY_NAMES[category_id]] = files
+            category_totals[CATEGORY_NAMES[category_id]] = bytes_by_id[category_id]
+    total_files = sum(len(files) for files in paths_by_id)
+    total_bytes = sum(bytes_by_id)
+    total_size = total_bytes / (1024 * 1024)
+
+    if not total_files:
         print("No files found to sort.")
         if is_frozen():
             input(CLOSE_PROMPT)
         return 0
 
-    # Group files by category for reporting
-    files_by_category = defaultdict(list)
-    total_size = 0
-
-    for file_path in all_files:
-        category = get_file_category(file_path)
-        files_by_category[category].append(file_path)
-        total_size += get_file_size_mb(file_path)
-
     # Show summary
-    total_files = len(all_files)
     total_categories = len(files_by_category)
 
     print(f"\n📊 Found {total_files} files ({total_size:.1f} MB) in {total_categories} categories:")
@@ -298,7 +487,7 @@ def main() -> int:
 
     for category, count in category_counts:
         percentage = (count / total_files) * 100
-        size_mb = sum(get_file_size_mb(f) for f in files_by_category[category])
+        size_mb = category_totals[category] / (1024 * 1024)
         print(f"   • {category}: {count} files ({percentage:.1f}%) - {size_mb:.1f} MB")
 
     # Ask for move/copy option
@@ -339,34 +528,58 @@ def main() -> int:
     # Sort files
     copied_count = 0
     failed_count = 0
-
-    for idx, file_path in enumerate(all_files, start=1):
-        try:
-            if idx % 50 == 0 or idx == total_files:
-                print(f"   Progress: {idx}/{total_files} files processed", end='\r')
-
-            move_or_copy_file_by_type(file_path, sorted_dir, move=move_files)
-            copied_count += 1
-
-        except Exception as e:
-            failed_count += 1
-            if failed_count <= 5:  # Show first few errors
-                print(f"\n   ❌ Error {'moving' if move_files else 'copying'} {file_path.name}: {e}")
+    done_counts: Dict[str, int] = defaultdict(int)
+    done_bytes: Dict[str, int] = defaultdict(int)
+
+    # Create every category folder once before the workers start; files are
+    # submitted from their category group so none is categorized twice
+    category_dirs = {}
+    for category in files_by_category:
+        (sorted_dir / category).mkdir(exist_ok=True)
+        category_dirs[category] = os.path.join(sorted_dir, category)
+    # Checked once: files below a mount point inside the tree still fall back per file
+    same_device = os.stat(sorted_dir).st_dev == os.stat(base_dir).st_dev
+
+    # Progress goes through a bound sys.stdout.write (looked up here, since the
+    # launcher swaps sys.stdout) and is throttled by count and by time
+    write, flush = sys.stdout.write, sys.stdout.flush
+    last_progress = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=max(1, args.max_concurrency)) as executor:
+        futures = {executor.submit(_copy_to_prepared, file_path, category_dirs[category], move_files, same_device): (file_path, size, category)
+                   for category, files in files_by_category.items()
+                   for file_path, size in files}
+        for idx, future in enumerate(as_completed(futures), start=1):
+            file_path, size, category = futures[future]
+            try:
+                now = time.monotonic()
+                if idx % PROGRESS_EVERY == 0 or idx == total_files or now - last_progress >= PROGRESS_INTERVAL:
+                    write(f"   Progress: {idx}/{total_files} files processed\r")
+                    flush()
+                    last_progress = now
+
+                future.result()
+                copied_count += 1
+                done_counts[category] += 1
+                done_bytes[category] += size
+
+            except Exception as e:
+                failed_count += 1
+                if failed_count <= 5:  # Show first few errors
+                    print(f"\n   ❌ Error {'moving' if move_files else 'copying'} {os.path.basename(file_path)}: {e}")
 
     print("\n\n✅ Sorting complete!")
     print(f"   Files {'moved' if move_files else 'copied'}: {copied_count}")
     print(f"   Failed: {failed_count}")
     print(f"   Total size: {total_size:.1f} MB")
 
-    # Show created folders
+    # Show created folders from the sizes gathered during the scan, instead of
+    # listing and stat'ing every sorted file again
     try:
-        created_folders = [f.name for f in sorted_dir.iterdir() if f.is_dir()]
-        created_folders.sort()
-        print(f"\n📁 Created {len(created_folders)} type folders:")
-        for folder in created_folders:
-            file_count = len(list((sorted_dir / folder).iterdir()))
-            folder_size = sum(get_file_size_mb(f) for f in (sorted_dir / folder).iterdir())
-            print(f"   • {folder}/ ({file_count} files, {folder_size:.1f} MB)")
+        print(f"\n📁 Created {len(done_counts)} type folders:")
+        for folder in sorted(done_counts):
+            folder_size = done_bytes[folder] / (1024 * 1024)
+            print(f"   • {folder}/ ({done_counts[folder]} files, {folder_size:.1f} MB)")
     except Exception:
         pass
 
@@ -381,20 +594,20 @@ def main() -> int:
     if "Images" in files_by_category:
         img_files = files_by_category["Images"]
         img_exts = defaultdict(int)
-        for f in img_files:
-            ext = f.suffix.lower()[1:] if f.suffix else "no_ext"
+        for f, _ in img_files:
+            ext = os.path.splitext(f)[1].lower()[1:] or "no_ext"
             img_exts[ext] += 1
         top_img = sorted(img_exts.items(), key=lambda x: x[1], reverse=True)[:3]
         print(f"   • Most common image formats: {', '.join(f'{ext} ({count})' for ext, count in top_img)}")
 
     if "Documents" in files_by_category:
         doc_files = files_by_category["Documents"]
-        doc_size = sum(get_file_size_mb(f) for f in doc_files)
+        doc_size = category_totals["Documents"] / (1024 * 1024)
         print(f"   • Document collection: {len(doc_files)} files totaling {doc_size:.1f} MB")
 
     if "Media" in files_by_category:
         media_files = files_by_category["Media"]
-        media_size = sum(get_file_size_mb(f) for f in media_files)
+        media_size = category_totals["Media"] / (1024 * 1024)
         print(f"   • Media collection: {len(media_files)} files totaling {media_size:.1f} MB")
 
     if is_frozen():
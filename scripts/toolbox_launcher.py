@@ -4,23 +4,29 @@ A Tkinter-based GUI that exposes buttons for each available standalone tool.
 Supports running as a script or packaged EXE.
 
 Behavior:
-- Each button launches the corresponding script in a separate subprocess (isolated).
+- Each button imports the corresponding tool and runs its main() on a background
+  thread; tools listed in ISOLATED_TOOLS (and, when running as a script, any tool
+  that fails to import) run in a separate subprocess instead.
 - Working directory = directory where the EXE/script is located (drop-and-run friendly).
 - Provides status area and minimal logging inside the UI.
-- Adds --run-tool internal argument to allow recursion or potential direct module dispatch later.
+- `--run-tool <key> [args...]` runs a single tool directly in the console instead of
+  opening the GUI (used by the per-tool stubs of the one-directory toolbox build).
 
 Dependencies: Only standard library (Tkinter is bundled with CPython on Windows).
 """
 from __future__ import annotations
 
 import sys
+import multiprocessing
 import subprocess
 import threading
 import queue
+from collections import deque
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Callable
+from types import ModuleType
+from typing import Deque, Dict, Callable, List, Sequence, Tuple
 import importlib.util
 import importlib
 
@@ -54,7 +60,84 @@ TOOLS: Dict[str, Dict[str, str]] = {
     "example_tool": {"label": "Example Tool", "script": "example_tool.py", "module": "scripts.example_tool", "desc": "Demo argument echo tool."},
 }
 
+# Tools that run in their own interpreter even when the launcher is a script:
+# nef_to_jpg's process pool needs its module importable by the workers
+ISOLATED_TOOLS = {"nef_to_jpg"}
+
+# Answers fed to a tool's input() prompts when it runs inside the GUI
+DEFAULT_INPUTS: Tuple[str, ...] = ("y",) * 10
+TOOL_INPUTS: Dict[str, Tuple[str, ...]] = {
+    # Report only; its menu rejects "y" and would ask again
+    "find_duplicates": ("r",),
+}
+# Empty answers (Enter) given once a tool's answers run out, before giving up
+MAX_EMPTY_ANSWERS = 3
+
 LOG_MAX_LINES = 500
+# Log messages drawn per pump tick, and how often the pump runs
+LOG_BATCH = 200
+LOG_PUMP_MS = 100
+
+# Imported tool modules, keyed by TOOLS[...]['module']
+_MODULE_CACHE: Dict[str, ModuleType] = {}
+# In-process tools share sys.std* and sys.argv, so only one runs at a time
+_RUN_LOCK = threading.Lock()
+
+
+class MockInput:
+    """Stand-in for sys.stdin that answers a fixed list of prompts.
+
+    Once the answers run out, the next MAX_EMPTY_ANSWERS prompts get an
+    empty answer (as if Enter was pressed), e.g. for the tools' final
+    "Press Enter to close"; after that reading raises EOFError, so a tool
+    that keeps re-asking fails instead of looping forever.
+    """
+
+    def __init__(self, lines: Sequence[str]):
+        self._lines = list(lines)
+        self._empty_left = MAX_EMPTY_ANSWERS
+
+    def readline(self, size: int = -1) -> str:
+        if self._lines:
+            return self._lines.pop(0) + "\n"
+        if self._empty_left <= 0:
+            raise EOFError("no more scripted input")
+        self._empty_left -= 1
+        return "\n"
+
+    def read(self, size: int = -1) -> str:
+        return self.readline()
+
+    def isatty(self) -> bool:
+        return False
+
+
+def load_tool_module(meta: Dict[str, str]) -> ModuleType:
+    """Import a tool's module once and cache it.
+
+    Bundled tools are imported by module name; as a script, the tool's file
+    is loaded from SCRIPTS_DIR since the repo root isn't on sys.path.
+    """
+    module_name = meta['module']
+    module = _MODULE_CACHE.get(module_name)
+    if module is not None:
+        return module
+    if IS_FROZEN:
+        module = importlib.import_module(module_name)
+    else:
+        script_path = (SCRIPTS_DIR / meta['script']).resolve()
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load {script_path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    _MODULE_CACHE[module_name] = module
+    return module
 
 class LauncherGUI:
     def __init__(self, root: tk.Tk):
@@ -64,6 +147,9 @@ class LauncherGUI:
         self.root.minsize(680, 480)
         self.processes = []  # Track subprocess PIDs
         self.log_queue: queue.Queue[str] = queue.Queue()
+        # What the Activity Log shows; the deque trims old lines for free
+        self.log_lines: Deque[str] = deque(maxlen=LOG_MAX_LINES)
+        self._shown_lines = 0
 
         self._build_ui()
         self._schedule_log_pump()
@@ -118,24 +204,32 @@ class LauncherGUI:
         desc = ttk.Label(frame, text=meta.get("desc", ""), anchor="w")
         desc.pack(side="left", fill="x", expand=True, padx=10)
 
-    def _append_log(self, text: str):
+    def _append_log(self, lines: List[str]):
+        """Show a batch of log lines with at most one delete and one insert."""
+        overflow = self._shown_lines + len(lines) > LOG_MAX_LINES
+        self.log_lines.extend(lines)
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", text.rstrip() + "\n")
-        # Trim
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > LOG_MAX_LINES:
-            self.log_text.delete('1.0', f"{lines-LOG_MAX_LINES}.0")
+        if overflow:
+            # The deque already dropped the oldest lines; redraw from it
+            self.log_text.delete("1.0", "end")
+            self.log_text.insert("end", "\n".join(self.log_lines) + "\n")
+            self._shown_lines = len(self.log_lines)
+        else:
+            self.log_text.insert("end", "\n".join(lines) + "\n")
+            self._shown_lines += len(lines)
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
     def _schedule_log_pump(self):
+        lines: List[str] = []
         try:
-            while True:
-                line = self.log_queue.get_nowait()
-                self._append_log(line)
+            for _ in range(LOG_BATCH):
+                lines.extend(self.log_queue.get_nowait().rstrip().split("\n"))
         except queue.Empty:
             pass
-        self.root.after(200, self._schedule_log_pump)
+        if lines:
+            self._append_log(lines)
+        self.root.after(LOG_PUMP_MS, self._schedule_log_pump)
 
     def _open_folder_dialog(self):
         folder = filedialog.askdirectory(initialdir=str(BASE_DIR))
@@ -147,25 +241,27 @@ class LauncherGUI:
         self.status_var.set(f"Launching {meta['label']}...")
         self.log_queue.put(f"[launch] {meta['label']}")
 
-        if IS_FROZEN:
-            # Try import first (module must be included by PyInstaller)
+        # Run in-process unless the tool needs isolation (only possible as a script)
+        if IS_FROZEN or key not in ISOLATED_TOOLS:
             module_name = meta.get('module')
-            if module_name:
-                try:
-                    module = importlib.import_module(module_name)
-                    run_func = getattr(module, 'main', None)
-                    if callable(run_func):
-                        threading.Thread(target=lambda: self._run_module_entry(run_func, meta['label']), daemon=True).start()
-                        self.log_queue.put(f"[module] Imported & running: {module_name}")
-                        return
-                except Exception as e:
-                    self.log_queue.put(f"[import-error] {module_name}: {e}")
-            # If import fails, inform user (cannot rely on external python in pure single EXE)
-            messagebox.showerror("Unavailable", f"Could not import tool module: {module_name}\nThe script may not have been bundled.")
-            self.status_var.set("Import failed.")
-            return
-
-        # Non-frozen: run via subprocess (keeps isolation and console output in separate window)
+            try:
+                module = load_tool_module(meta)
+                run_func = getattr(module, 'main', None)
+                if callable(run_func):
+                    inputs = TOOL_INPUTS.get(key, DEFAULT_INPUTS)
+                    threading.Thread(target=lambda: self._run_module_entry(run_func, meta, inputs), daemon=True).start()
+                    self.log_queue.put(f"[module] Imported & running: {module_name}")
+                    return
+                self.log_queue.put(f"[import-error] {module_name}: no main()")
+            except Exception as e:
+                self.log_queue.put(f"[import-error] {module_name}: {e}")
+            if IS_FROZEN:
+                # Cannot rely on an external python in a pure single EXE
+                messagebox.showerror("Unavailable", f"Could not import tool module: {module_name}\nThe script may not have been bundled.")
+                self.status_var.set("Import failed.")
+                return
+
+        # Run via subprocess (isolation, console output in the launcher's console)
         script_path = (SCRIPTS_DIR / meta['script']).resolve()
         if not script_path.exists():
             messagebox.showerror("Missing", f"Script not found: {script_path}")
@@ -185,36 +281,48 @@ class LauncherGUI:
         self.log_queue.put(f"[pid {proc.pid}] {label} exited with code {rc}")
         self.status_var.set(f"Finished: {label} (code {rc})")
 
-    def _run_module_entry(self, func: Callable, label: str):
+    def _run_module_entry(self, func: Callable, meta: Dict[str, str], inputs: Sequence[str]):
+        label = meta['label']
+        if not _RUN_LOCK.acquire(blocking=False):
+            self.log_queue.put(f"[module] {label} waiting for the running tool to finish")
+            _RUN_LOCK.acquire()
         try:
-            # Redirect stdin, stdout, stderr to prevent "lost sys.std*" errors in GUI context
-            import io
-            original_stdin = sys.stdin
-            original_stdout = sys.stdout
-            original_stderr = sys.stderr
-            
-            # Provide mock input that simulates user pressing Enter or answering 'y' to prompts
-            # Most tools ask for confirmation - we'll auto-confirm since user clicked the button
-            mock_inputs = "y\n" * 10  # Provide multiple 'y' responses for any confirmation prompts
-            sys.stdin = io.StringIO(mock_inputs)
+            self._run_module_locked(func, meta, inputs)
+        finally:
+            _RUN_LOCK.release()
+
+    def _log_captured(self, label: str, captured_output) -> None:
+        """Log what a tool printed (truncated if too long)."""
+        output_text = captured_output.getvalue()
+        if output_text.strip():
+            # Truncate long output for UI display
+            if len(output_text) > 500:
+                output_text = output_text[:500] + "...[truncated]"
+            self.log_queue.put(f"[output] {label}: {output_text.strip()}")
+
+    def _run_module_locked(self, func: Callable, meta: Dict[str, str], inputs: Sequence[str]):
+        label = meta['label']
+        # Redirect stdin, stdout, stderr to prevent "lost sys.std*" errors in GUI context
+        import io
+        original_stdin = sys.stdin
+        original_stdout = sys.stdout
+        original_stderr = sys.stderr
+        original_argv = sys.argv
+        captured_output = io.StringIO()
+        try:
+            # Answer the tool's confirmation prompts, since the user clicked the button
+            sys.stdin = MockInput(inputs)
+            # Tools parse their own flags; give them none
+            sys.argv = [meta['script']]
             
-            captured_output = io.StringIO()
             sys.stdout = captured_output
             sys.stderr = captured_output
             
             rc = func()
-            
-            # Log any captured output (truncate if too long)
-            output_text = captured_output.getvalue()
-            if output_text.strip():
-                # Truncate long output for UI display
-                if len(output_text) > 500:
-                    output_text = output_text[:500] + "...[truncated]"
-                self.log_queue.put(f"[output] {label}: {output_text.strip()}")
-                
         except SystemExit as se:
             rc = int(se.code) if hasattr(se, 'code') and se.code is not None else 0
         except Exception as e:
+            self._log_captured(label, captured_output)
             self.log_queue.put(f"[error] {label} crashed: {e}")
             self.status_var.set(f"Error: {label}")
             return
@@ -223,17 +331,51 @@ class LauncherGUI:
             sys.stdin = original_stdin
             sys.stdout = original_stdout
             sys.stderr = original_stderr
-            
+            sys.argv = original_argv
+        
+        self._log_captured(label, captured_output)
         self.log_queue.put(f"[module] {label} finished with code {rc}")
         self.status_var.set(f"Finished: {label} (code {rc})")
 
 
+def run_tool(key: str, args: list) -> int:
+    """Run one tool directly in this console (used by the toolbox .cmd stubs)."""
+    meta = TOOLS.get(key)
+    if meta is None:
+        print(f"Unknown tool: {key}. Available: {', '.join(TOOLS)}")
+        return 1
+
+    if not IS_FROZEN:
+        script_path = (SCRIPTS_DIR / meta['script']).resolve()
+        return subprocess.call([sys.executable, str(script_path), *args])
+
+    module = importlib.import_module(meta['module'])
+    sys.argv = [meta['script'], *args]
+    # Run the tool in script mode: it operates on the current folder (where the
+    # stub was invoked) rather than next to the shared toolbox EXE. Only the
+    # tool's own is_frozen() is overridden; sys.frozen must stay set so
+    # multiprocessing keeps spawning workers through this EXE.
+    frozen_check = module.is_frozen
+    module.is_frozen = lambda: False
+    try:
+        rc = module.main()
+    except SystemExit as se:
+        rc = se.code
+    finally:
+        module.is_frozen = frozen_check
+    if rc is None:
+        return 0
+    return rc if isinstance(rc, int) else 1
+
+
 def main() -> int:
-    # Internal dispatch option placeholder (future use)
+    # Direct dispatch: toolbox.exe --run-tool <key> [tool args...]
     if '--run-tool' in sys.argv:
-        # Could implement direct import dispatch here if desired
-        print("Direct dispatch not yet implemented.")
-        return 1
+        idx = sys.argv.index('--run-tool')
+        if idx + 1 >= len(sys.argv):
+            print(f"Usage: --run-tool <tool> [args...]. Available: {', '.join(TOOLS)}")
+            return 1
+        return run_tool(sys.argv[idx + 1], sys.argv[idx + 2:])
 
     root = tk.Tk()
     LauncherGUI(root)
@@ -241,4 +383,6 @@ def main() -> int:
     return 0
 
 if __name__ == '__main__':
+    # Tools may use process pools; worker processes re-enter this EXE
+    multiprocessing.freeze_support()
     raise SystemExit(main())
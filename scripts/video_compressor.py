@@ -15,13 +15,18 @@ converted_videos/
 
 Dependencies:
 - ffmpeg-python for Python FFmpeg bindings
+- PyAV (optional): when installed, videos are encoded in-process instead of starting
+  ffmpeg for each one (--backend picks explicitly)
 - FFmpeg binaries (bundled with EXE or auto-downloaded)
 
 Notes:
 - If double-clicking the EXE, a prompt at the end will keep the console open.
 - Supports common video formats: MP4, AVI, MOV, MKV, WMV, FLV, WEBM, etc.
 - Handles duplicate filenames by adding numeric suffixes.
-- Quality presets: high, medium, low (adjustable CRF values).
+- Quality presets: high, medium, low (adjustable CRF values). --quality or
+  VIDEO_COMPRESSOR_QUALITY picks one; the EXE only asks when double-clicked.
+- Encodes on the GPU (NVENC, Quick Sync, VAAPI, VideoToolbox) when FFmpeg can use one,
+  otherwise with libx264. --codec or VIDEO_COMPRESSOR_CODEC picks one explicitly.
 - FFmpeg is automatically bundled - no separate installation needed!
 """
 
@@ -29,17 +34,33 @@ from __future__ import annotations
 
 import sys
 import os
+import argparse
+import json
+import math
+import selectors
 import subprocess
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 import tempfile
 import shutil
 
+# Optional in-process FFmpeg (PyAV); None when missing
+try:
+    import av as _AV  # type: ignore
+except ImportError:
+    _AV = None
+
 # Common video extensions
-VIDEO_EXTENSIONS = {
+VIDEO_EXTENSIONS = frozenset({
     '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v',
     '.mpg', '.mpeg', '.3gp', '.asf', '.rm', '.rmvb', '.vob', '.ts'
-}
+})
 
 # Quality presets (CRF values - lower = better quality/larger size)
 QUALITY_PRESETS = {
@@ -50,6 +71,73 @@ QUALITY_PRESETS = {
 
 DEFAULT_QUALITY = 'medium'
 
+# Hardware encoders ignore CRF; these are their constant-quality (CQ/QP) levels
+HW_QUALITY_PRESETS = {
+    'high': 19,
+    'medium': 24,
+    'low': 30
+}
+# VideoToolbox takes -q:v from 1 to 100, higher = better
+VIDEOTOOLBOX_QUALITY = {
+    'high': 70,
+    'medium': 55,
+    'low': 40
+}
+
+SOFTWARE_ENCODER = 'libx264'
+# libx264 speed preset per quality. aq-mode=3 and a longer lookahead keep
+# quality at a given CRF while 'faster' needs far fewer cycles per frame.
+X264_PRESETS = {
+    'high': 'medium',
+    'medium': 'faster',
+    'low': 'faster'
+}
+X264_PARAMS = 'aq-mode=3:rc-lookahead=40'
+# Values for --tune (libx264 only)
+TUNE_CHOICES = ('film', 'animation', 'grain', 'stillimage', 'fastdecode', 'zerolatency')
+# Tried in this order; the first that can actually encode on this machine wins
+HW_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_vaapi', 'h264_videotoolbox')
+# --codec names -> encoder
+CODEC_CHOICES = {
+    'auto': None,
+    'nvenc': 'h264_nvenc',
+    'qsv': 'h264_qsv',
+    'vaapi': 'h264_vaapi',
+    'videotoolbox': 'h264_videotoolbox',
+    'x264': SOFTWARE_ENCODER,
+}
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+# Rough H.264 bits per pixel per frame at each quality preset; inputs that are
+# already H.264 at or below this rate (plus the margin) are stream-copied
+BITS_PER_PIXEL = {
+    'high': 0.12,
+    'medium': 0.08,
+    'low': 0.05
+}
+STREAM_COPY_MARGIN = 1.2
+# Sources below that rate get a higher CRF (3 per halving, at most this much
+# above the preset): there is no detail left for the preset's CRF to keep
+MAX_CRF_RAISE = 4
+
+# In the output folder: which video each output file was made from
+OUTPUT_MANIFEST = "sources.json"
+
+# FFmpeg is killed once its progress has been stuck this long
+STALL_SECONDS = 120
+# stderr kept for error messages: at most this many lines, and this many bytes of them
+STDERR_TAIL_LINES = 200
+STDERR_TAIL_BYTES = 4096
+# Python opens files non-inheritable, so on POSIX there is nothing for a child
+# to close; skipping that lets subprocess use posix_spawn (vfork) per FFmpeg.
+# Windows keeps the default, which stops other handles leaking into children.
+SPAWN_CLOSE_FDS = os.name == 'nt'
+
+# libx264 threads per FFmpeg process when several files are encoded at once
+THREADS_PER_FFMPEG = 2
+# A GPU has only one or two encoder engines, so more sessions just queue up
+MAX_HW_JOBS = 2
+
 
 def is_frozen() -> bool:
     return getattr(sys, "frozen", False)
@@ -62,33 +150,109 @@ def get_base_dir() -> Path:
     return Path.cwd()
 
 
-def iter_video_files(root: Path) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Skip the converted_videos folder itself if it already exists
-        if Path(dirpath) == (root / "converted_videos"):
+def iter_video_files(root: Path) -> Iterable[Tuple[Path, int]]:
+    """Yield (path, size in bytes) for every video under root.
+
+    The size comes from the scandir entry, so no separate stat is needed.
+    """
+    output_dir = str(root / "converted_videos")
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip the converted_videos folder itself if it already exists
+                        if entry.path != output_dir and not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        # Suffix sliced by hand (dotfiles have none); only matches become Paths
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot > 0 and name[dot:].lower() in VIDEO_EXTENSIONS:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                size = 0
+                            yield Path(entry.path), size
+        except OSError:
             continue
-        for name in filenames:
-            if Path(name).suffix.lower() in VIDEO_EXTENSIONS:
-                yield Path(dirpath) / name
 
 
-def unique_path(path: Path) -> Path:
-    """Generate a unique path if file already exists by adding numeric suffix."""
-    if not path.exists():
-        return path
-    
-    base = path.with_suffix("")
-    suffix = path.suffix
-    i = 1
-    while True:
-        cand = base.with_name(f"{base.name}_{i}").with_suffix(suffix)
-        if not cand.exists():
-            return cand
-        i += 1
+def _source_key(video_path: Path, root: Path) -> str:
+    """Stable key for a video: its path relative to root, normcased."""
+    try:
+        rel = video_path.relative_to(root)
+    except ValueError:
+        rel = video_path
+    return os.path.normcase(rel.as_posix())
 
 
+def load_output_manifest(output_dir: Path) -> Dict[str, str]:
+    """Read {output file name: source key} written by earlier runs."""
+    try:
+        data = json.loads((output_dir / OUTPUT_MANIFEST).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def save_output_manifest(output_dir: Path, manifest: Dict[str, str]) -> None:
+    """Write the manifest atomically, so a crash can't leave half of it."""
+    path = output_dir / OUTPUT_MANIFEST
+    tmp = path.with_name(path.name + '.part')
+    try:
+        tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️  Could not save {path.name}: {e}")
+
+
+def assign_output_paths(video_paths: List[Path], output_dir: Path, root: Path,
+                        manifest: Dict[str, str]) -> List[Path]:
+    """Output path for each video: <stem>_compressed.mp4, numbered for repeated stems.
+
+    manifest ({output name: source key}, updated in place) remembers which
+    video each name was given to, so a video keeps its output across runs even
+    when other videos with the same stem are added or deleted, and a name
+    stays claimed while its output exists. New videos take the first free
+    name in sorted-path order; an output left by a run without a manifest is
+    claimed by the first video that would have been given it. Names are
+    compared through os.path.normcase (case-insensitive on Windows).
+    """
+    keys = {video_path: _source_key(video_path, root) for video_path in video_paths}
+    current = set(keys.values())
+    # Forget names whose source and output are both gone
+    for name, key in list(manifest.items()):
+        if key not in current and not (output_dir / name).exists():
+            del manifest[name]
+    taken = {os.path.normcase(name) for name in manifest}
+    by_key = {key: name for name, key in manifest.items()}
+    outputs = {}
+    for video_path in sorted(video_paths, key=lambda p: keys[p]):
+        key = keys[video_path]
+        if key in by_key:
+            outputs[video_path] = output_dir / by_key[key]
+            continue
+        stem = f"{video_path.stem}_compressed"
+        cand = f"{stem}.mp4"
+        i = 1
+        while os.path.normcase(cand) in taken:
+            cand = f"{stem}_{i}.mp4"
+            i += 1
+        taken.add(os.path.normcase(cand))
+        manifest[cand] = key
+        outputs[video_path] = output_dir / cand
+    return [outputs[video_path] for video_path in video_paths]
+
+
+@lru_cache(maxsize=1)
 def get_ffmpeg_path() -> str:
-    """Get the path to FFmpeg executable, using bundled version if available."""
+    """Get the path to FFmpeg executable, using bundled version if available.
+
+    Cached: the bundle doesn't change while the tool runs, and every
+    compress_video call asks for it.
+    """
     # When frozen (EXE), look for bundled FFmpeg in temp extraction folder
     if is_frozen():
         # PyInstaller extracts to _MEIXXXXXX temp folder
@@ -107,10 +271,11 @@ def get_ffmpeg_path() -> str:
                 if ffmpeg_path.exists():
                     return str(ffmpeg_path)
     
-    # Fallback to system PATH
-    return 'ffmpeg'
+    # Fallback to system PATH, resolved once so each spawn doesn't search it again
+    return shutil.which('ffmpeg') or 'ffmpeg'
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> tuple[bool, str]:
     """Check if FFmpeg is available and return status and path."""
     ffmpeg_path = get_ffmpeg_path()
@@ -134,43 +299,513 @@ def download_ffmpeg_if_needed() -> Optional[str]:
         return None
 
 
-def compress_video(input_path: Path, output_path: Path, quality: str = DEFAULT_QUALITY) -> None:
-    """Compress video using FFmpeg with specified quality preset."""
-    crf = QUALITY_PRESETS.get(quality.lower(), QUALITY_PRESETS[DEFAULT_QUALITY])
+def _probe_encoder(ffmpeg_path: str, encoder: str) -> bool:
+    """Encode one tiny synthetic frame to check the encoder's hardware is present.
+
+    FFmpeg lists NVENC/QSV encoders even on machines without the GPU, so
+    only a real (throwaway) encode tells whether they work.
+    """
+    # GPU decoding doesn't apply to the synthetic input
+    pre_input, video_args = _encoder_args(encoder, DEFAULT_QUALITY, hw_decode=False)
+    cmd = [ffmpeg_path, '-hide_banner', '-loglevel', 'error', *pre_input,
+           '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+           '-frames:v', '1', *video_args, '-f', 'null', '-']
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=20).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+@lru_cache(maxsize=None)
+def detect_hwaccel(ffmpeg_path: str) -> str:
+    """Return the best H.264 encoder this FFmpeg can use here (cached).
+
+    Hardware encoders run on the GPU's fixed-function encoder instead of
+    the CPU cores; libx264 is the fallback.
+    """
+    try:
+        listed = subprocess.run([ffmpeg_path, '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return SOFTWARE_ENCODER
+    names = {line.split()[1] for line in listed.splitlines() if len(line.split()) > 1}
+    for encoder in HW_ENCODERS:
+        if encoder == 'h264_videotoolbox' and sys.platform != 'darwin':
+            continue
+        if encoder == 'h264_vaapi' and not os.path.exists(VAAPI_DEVICE):
+            continue
+        if encoder in names and _probe_encoder(ffmpeg_path, encoder):
+            return encoder
+    return SOFTWARE_ENCODER
+
+
+def _encoder_args(encoder: str, quality: str, hw_decode: bool = True,
+                  tune: Optional[str] = None, crf: Optional[int] = None,
+                  max_height: Optional[int] = None) -> Tuple[List[str], List[str]]:
+    """Return (arguments before -i, video encoding arguments) for an encoder.
+
+    tune is passed to libx264's -tune and crf replaces the preset's CRF there;
+    hardware encoders ignore both. Videos taller than max_height are scaled down to it.
+    """
+    quality = quality.lower() if quality.lower() in QUALITY_PRESETS else DEFAULT_QUALITY
+    cq = str(HW_QUALITY_PRESETS[quality])
+    # min() leaves smaller videos alone; -2 keeps the aspect ratio with an even width
+    scale = [f"scale=-2:'min(ih,{max_height})'"] if max_height else []
+    scale_args = ['-vf', scale[0]] if scale else []
+    if encoder == 'h264_nvenc':
+        if hw_decode:
+            # Decode on the GPU too and keep frames there for the encoder,
+            # scaling them there as well: no frame crosses PCIe
+            gpu_scale = ['-vf', f"scale_cuda=-2:'min(ih,{max_height})'"] if max_height else []
+            return (['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'],
+                    [*gpu_scale, '-c:v', 'h264_nvenc', '-rc', 'vbr', '-cq', cq, '-b:v', '0', '-preset', 'p4'])
+        return [], [*scale_args, '-c:v', 'h264_nvenc', '-rc', 'vbr', '-cq', cq, '-b:v', '0', '-preset', 'p4']
+    if encoder == 'h264_qsv':
+        return [], [*scale_args, '-c:v', 'h264_qsv', '-global_quality', cq, '-preset', 'medium']
+    if encoder == 'h264_vaapi':
+        return (['-vaapi_device', VAAPI_DEVICE],
+                ['-vf', ','.join([*scale, 'format=nv12', 'hwupload']), '-c:v', 'h264_vaapi', '-qp', cq])
+    if encoder == 'h264_videotoolbox':
+        return [], [*scale_args, '-c:v', 'h264_videotoolbox', '-q:v', str(VIDEOTOOLBOX_QUALITY[quality])]
+    return [], [
+        *scale_args,
+        '-c:v', SOFTWARE_ENCODER,                  # Video codec
+        '-crf', str(crf or QUALITY_PRESETS[quality]),  # Quality setting
+        '-preset', X264_PRESETS[quality],          # Encoding speed/efficiency balance
+        '-x264-params', X264_PARAMS,
+        *(['-tune', tune] if tune else []),
+    ]
+
+
+def _progress_moved(line: bytes, position: dict) -> bool:
+    """Record one raw -progress line; True if the frame count or output time moved."""
+    key, _, value = line.strip().partition(b'=')
+    if key in (b'frame', b'out_time_ms') and position.get(key) != value:
+        position[key] = value
+        return True
+    return False
+
+
+def _follow_threaded(proc: subprocess.Popen, stderr_tail: Deque[bytes]) -> bool:
+    """Read FFmpeg's pipes with a stderr thread and a polling watchdog; True if it stalled."""
+    last_progress = [time.monotonic()]
+    stalled = threading.Event()
+    
+    def drain_stderr() -> None:
+        for line in proc.stderr:
+            stderr_tail.append(line.rstrip())
+    
+    def watchdog() -> None:
+        while proc.poll() is None:
+            if time.monotonic() - last_progress[0] > STALL_SECONDS:
+                stalled.set()
+                proc.kill()
+                return
+            time.sleep(1)
+    
+    readers = [threading.Thread(target=drain_stderr, daemon=True),
+               threading.Thread(target=watchdog, daemon=True)]
+    for thread in readers:
+        thread.start()
+    
+    position = {}
+    for line in proc.stdout:
+        if _progress_moved(line, position):
+            last_progress[0] = time.monotonic()
+    
+    proc.wait()
+    for thread in readers:
+        thread.join()
+    return stalled.is_set()
+
+
+def _follow_selector(proc: subprocess.Popen, stderr_tail: Deque[bytes]) -> bool:
+    """Read both of FFmpeg's pipes from this thread alone; True if it stalled.
+
+    One select() waits for progress, errors and the stall deadline at once,
+    instead of a stderr thread and a watchdog thread per running FFmpeg.
+    POSIX only: Windows can't select() on pipes.
+    """
+    sel = selectors.DefaultSelector()
+    stdout_fd, stderr_fd = proc.stdout.fileno(), proc.stderr.fileno()
+    sel.register(stdout_fd, selectors.EVENT_READ)
+    sel.register(stderr_fd, selectors.EVENT_READ)
+    partial = {stdout_fd: b'', stderr_fd: b''}
+    position = {}
+    last_progress = time.monotonic()
+    try:
+        while sel.get_map():
+            for key, _ in sel.select(timeout=1):
+                data = os.read(key.fd, 65536)
+                if data:
+                    *lines, partial[key.fd] = (partial[key.fd] + data).split(b'\n')
+                else:
+                    # EOF: whatever is left is the last (unterminated) line
+                    sel.unregister(key.fd)
+                    lines = [partial[key.fd]] if partial[key.fd] else []
+                for line in lines:
+                    if key.fd == stderr_fd:
+                        stderr_tail.append(line.rstrip())
+                    elif _progress_moved(line, position):
+                        last_progress = time.monotonic()
+            if time.monotonic() - last_progress > STALL_SECONDS:
+                proc.kill()
+                return True
+        return False
+    finally:
+        sel.close()
+
+
+def _run_ffmpeg(cmd: List[str]) -> Tuple[int, str, bool]:
+    """Run FFmpeg (with -progress pipe:1), killing it only if it stops progressing.
+
+    Long encodes run as long as they need; a process whose frame count and
+    output time haven't moved for STALL_SECONDS is killed. Only the last
+    lines of stderr are kept, as raw bytes; they are only decoded into the
+    returned tail when FFmpeg failed (empty on success).
+    Returns (return code, stderr tail, stalled).
+    """
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, close_fds=SPAWN_CLOSE_FDS)
+    stderr_tail: Deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
+    follow = _follow_threaded if os.name == 'nt' else _follow_selector
+    with proc:
+        stalled = follow(proc, stderr_tail)
+        returncode = proc.wait()
+    if returncode == 0:
+        return returncode, "", stalled
+    tail = b"\n".join(stderr_tail)[-STDERR_TAIL_BYTES:]
+    return returncode, tail.decode('utf-8', 'replace'), stalled
+
+
+class EncodeError(Exception):
+    """A video that couldn't be compressed.
+
+    Carries the input path, FFmpeg's return code (None when FFmpeg didn't
+    run or the PyAV backend failed) and a short, bounded reason, so main()
+    can tally failures without keeping whole error logs around.
+    """
+    
+    def __init__(self, path: Path, returncode: Optional[int], reason: str):
+        super().__init__(f"Compression failed: {reason}")
+        self.path = path
+        self.returncode = returncode
+        self.reason = reason
+
+
+# MP4 layouts: faststart moves the index to the front in a second pass over
+# the finished file; fragmented MP4 is playable as written, in one pass
+FASTSTART_MOVFLAGS = '+faststart'
+FRAGMENTED_MOVFLAGS = '+frag_keyframe+empty_moov+default_base_moof'
+
+
+def compress_video(input_path: Path, output_path: Path, quality: str = DEFAULT_QUALITY,
+                   encoder: Optional[str] = None, threads: Optional[int] = None,
+                   tune: Optional[str] = None, movflags: str = FASTSTART_MOVFLAGS,
+                   crf: Optional[int] = None, max_height: Optional[int] = None,
+                   hw_decode: bool = True) -> None:
+    """Compress video using FFmpeg with specified quality preset.
+
+    encoder defaults to the best one detect_hwaccel finds. If a hardware
+    encoder fails on this file, it is retried with libx264 (NVENC first
+    retries with CPU decoding, for codecs the GPU can't decode). threads caps
+    FFmpeg's own threads, for when several files are compressed at once
+    (otherwise -threads 0 lets libx264 use every core); tune is libx264's -tune.
+    movflags is FASTSTART_MOVFLAGS or FRAGMENTED_MOVFLAGS; crf and max_height
+    are as for _encoder_args.
+    """
     ffmpeg_path = get_ffmpeg_path()
+    if encoder is None:
+        encoder = detect_hwaccel(ffmpeg_path)
+    pre_input, video_args = _encoder_args(encoder, quality, hw_decode, tune=tune, crf=crf, max_height=max_height)
     
     # FFmpeg command for H.264 compression with good compatibility
     cmd = [
         ffmpeg_path,
+        '-progress', 'pipe:1',      # Machine-readable progress on stdout
+        '-nostats',
+        '-loglevel', 'error',
+        *pre_input,
         '-i', str(input_path),
-        '-c:v', 'libx264',          # Video codec
-        '-crf', str(crf),           # Quality setting
-        '-preset', 'medium',        # Encoding speed/efficiency balance
+        *video_args,
+        '-threads', str(threads or 0),
         '-c:a', 'aac',              # Audio codec
         '-b:a', '128k',             # Audio bitrate
-        '-movflags', '+faststart',  # Web optimization
+        '-f', 'mp4',
+        '-movflags', movflags,      # Web optimization
         '-y',                       # Overwrite output file
         str(output_path)
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        if result.returncode != 0:
-            raise Exception(f"FFmpeg error: {result.stderr}")
-    except subprocess.TimeoutExpired:
-        raise Exception("FFmpeg timed out (5 minutes limit)")
+        returncode, stderr_tail, stalled = _run_ffmpeg(cmd)
     except Exception as e:
-        raise Exception(f"Compression failed: {e}")
+        raise EncodeError(input_path, None, str(e))
+    if returncode != 0 and encoder == 'h264_nvenc' and hw_decode and not stalled:
+        # e.g. a source codec NVDEC can't decode: keep the GPU encoder
+        return compress_video(input_path, output_path, quality, encoder, threads, tune, movflags,
+                              crf=crf, max_height=max_height, hw_decode=False)
+    if returncode != 0 and encoder != SOFTWARE_ENCODER:
+        # e.g. a codec or size the GPU can't handle
+        return compress_video(input_path, output_path, quality, SOFTWARE_ENCODER, threads, tune, movflags,
+                              crf=crf, max_height=max_height)
+    if stalled:
+        raise EncodeError(input_path, returncode, f"FFmpeg made no progress for {STALL_SECONDS} seconds")
+    if returncode != 0:
+        raise EncodeError(input_path, returncode, f"FFmpeg error: {stderr_tail}")
+
+
+# Encoders compress_video_pyav drives itself (others fall back to libx264 there)
+PYAV_ENCODERS = (SOFTWARE_ENCODER, 'h264_nvenc')
+
+
+def pyav_supports(encoder: str) -> bool:
+    """True if PyAV is installed and can use this encoder as is."""
+    return _AV is not None and encoder in PYAV_ENCODERS and encoder in _AV.codecs_available
+
 
+def compress_video_pyav(input_path: Path, output_path: Path, quality: str = DEFAULT_QUALITY,
+                        encoder: Optional[str] = None, threads: Optional[int] = None,
+                        tune: Optional[str] = None, movflags: str = FASTSTART_MOVFLAGS,
+                        crf: Optional[int] = None, max_height: Optional[int] = None) -> None:
+    """Compress video in-process with PyAV, with the same settings as compress_video.
+
+    Saves starting an FFmpeg process per file, which dominates on short
+    clips. Only NVENC and libx264 are driven this way; other hardware
+    encoders need device setup that the FFmpeg command line handles, so
+    they use libx264 here. If PyAV fails on a file (e.g. a stream without a
+    frame rate), the file is compressed again with compress_video, which
+    also handles falling back from the GPU encoder.
+    """
+    requested_encoder = encoder or SOFTWARE_ENCODER
+    quality = quality.lower() if quality.lower() in QUALITY_PRESETS else DEFAULT_QUALITY
+    if encoder == 'h264_nvenc':
+        options = {'rc': 'vbr', 'cq': str(HW_QUALITY_PRESETS[quality]), 'b': '0', 'preset': 'p4'}
+    else:
+        encoder = SOFTWARE_ENCODER
+        options = {'crf': str(crf or QUALITY_PRESETS[quality]), 'preset': X264_PRESETS[quality],
+                   'x264-params': X264_PARAMS}
+        if tune:
+            options['tune'] = tune
+    if threads:
+        options['threads'] = str(threads)
+    
+    try:
+        with _AV.open(str(input_path)) as src, \
+                _AV.open(str(output_path), 'w', format='mp4', options={'movflags': movflags}) as dst:
+            in_video = src.streams.video[0]
+            in_video.thread_type = 'AUTO'
+            out_video = dst.add_stream(encoder, rate=in_video.average_rate, options=options)
+            width, height = in_video.codec_context.width, in_video.codec_context.height
+            scaled = bool(max_height) and height > max_height
+            if scaled:
+                # Same as the ffmpeg path's scale=-2:min(ih,max_height)
+                width, height = 2 * round(width * max_height / height / 2), max_height
+            out_video.width = width
+            out_video.height = height
+            out_video.pix_fmt = 'yuv420p'
+            
+            in_audio = src.streams.audio[0] if src.streams.audio else None
+            out_audio = None
+            if in_audio is not None:
+                out_audio = dst.add_stream('aac', rate=in_audio.rate)
+                out_audio.bit_rate = 128000
+            
+            targets = {in_video: out_video}
+            if in_audio is not None:
+                targets[in_audio] = out_audio
+            for packet in src.demux(*targets):
+                out_stream = targets[packet.stream]
+                for frame in packet.decode():
+                    if scaled and out_stream is out_video:
+                        frame = frame.reformat(width=width, height=height)
+                    dst.mux(out_stream.encode(frame))
+            # Flush the encoders
+            for out_stream in targets.values():
+                dst.mux(out_stream.encode(None))
+    except Exception:
+        return compress_video(input_path, output_path, quality, requested_encoder, threads, tune, movflags,
+                              crf=crf, max_height=max_height)
+
+
+MB = 1024 * 1024
+
+
+# How much of the next video to pull into the page cache while the current ones encode
+PREFETCH_BYTES = 64 * MB
+
+
+def advise_cache(path: Path, advice: str, length: int = 0) -> None:
+    """posix_fadvise the start of a file (whole file if length is 0); no-op where unsupported.
+
+    advice is 'WILLNEED' (start reading it in the background) or 'DONTNEED'
+    (drop it from the page cache). Windows has no equivalent, so nothing happens there.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, length, getattr(os, f'POSIX_FADV_{advice}'))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def get_ffprobe_path() -> Optional[str]:
+    """Find ffprobe next to the FFmpeg in use, or on PATH (None if absent).
+
+    The EXE bundles only ffmpeg.exe, so the stream-copy check is skipped there
+    unless ffprobe is installed separately.
+    """
+    ffmpeg_path = get_ffmpeg_path()
+    folder = os.path.dirname(ffmpeg_path)
+    if folder:
+        for name in ('ffprobe.exe', 'ffprobe'):
+            candidate = os.path.join(folder, name)
+            if os.path.isfile(candidate):
+                return candidate
+    return shutil.which('ffprobe')
+
+
+def probe_video(path: Path) -> dict:
+    """Return codec_name, width, height, avg_frame_rate and bit_rate of the first video stream.
+
+    bit_rate falls back to the container's overall bit rate (MKV and some
+    other containers don't store one per stream). Empty if ffprobe is unavailable.
+    """
+    ffprobe_path = get_ffprobe_path()
+    if ffprobe_path is None:
+        return {}
+    cmd = [ffprobe_path, '-v', 'error', '-select_streams', 'v:0',
+           '-show_entries', 'stream=codec_name,width,height,avg_frame_rate,bit_rate:format=bit_rate',
+           '-of', 'json', str(path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30,
+                                close_fds=SPAWN_CLOSE_FDS)
+        data = json.loads(result.stdout or '{}')
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return {}
+    streams = data.get('streams') or [{}]
+    info = dict(streams[0])
+    if not str(info.get('bit_rate', '')).isdigit():
+        info['bit_rate'] = data.get('format', {}).get('bit_rate')
+    return info
+
+
+def target_bitrate(info: dict, quality: str) -> Optional[int]:
+    """Rough bit rate (bits/s) an H.264 encode at this quality would produce."""
+    try:
+        num, _, den = info['avg_frame_rate'].partition('/')
+        fps = float(num) / float(den or 1)
+        pixels = int(info['width']) * int(info['height'])
+    except (KeyError, ValueError, ZeroDivisionError):
+        return None
+    return int(pixels * fps * BITS_PER_PIXEL.get(quality, BITS_PER_PIXEL[DEFAULT_QUALITY]))
+
+
+def can_stream_copy(info: dict, quality: str) -> bool:
+    """True if the probed video is already H.264 at (about) the bit rate we would encode to."""
+    if info.get('codec_name') != 'h264' or not str(info.get('bit_rate', '')).isdigit():
+        return False
+    target = target_bitrate(info, quality)
+    return target is not None and int(info['bit_rate']) <= target * STREAM_COPY_MARGIN
+
+
+def adaptive_crf(info: dict, quality: str) -> Optional[int]:
+    """libx264 CRF for a probed video, or None to use the preset's.
+
+    Only sources already below the preset's rough bit rate get one: each
+    halving below it raises the CRF by 3, up to MAX_CRF_RAISE.
+    """
+    target = target_bitrate(info, quality)
+    try:
+        bitrate = int(info['bit_rate'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not target or not 0 < bitrate < target:
+        return None
+    raise_by = min(MAX_CRF_RAISE, round(3 * math.log2(target / bitrate)))
+    return QUALITY_PRESETS[quality] + raise_by if raise_by else None
 
-def get_file_size_mb(path: Path) -> float:
-    """Get file size in MB."""
-    return path.stat().st_size / (1024 * 1024)
+
+def stream_copy(input_path: Path, output_path: Path, movflags: str = FASTSTART_MOVFLAGS) -> bool:
+    """Remux the video into MP4 without re-encoding; False if FFmpeg refuses.
+
+    Fails e.g. when the audio codec isn't allowed in MP4; the caller then encodes.
+    """
+    cmd = [get_ffmpeg_path(), '-progress', 'pipe:1', '-nostats', '-loglevel', 'error',
+           '-i', str(input_path), '-map', '0:v:0', '-map', '0:a?', '-c', 'copy',
+           '-f', 'mp4', '-movflags', movflags, '-y', str(output_path)]
+    try:
+        returncode, _, _ = _run_ffmpeg(cmd)
+    except OSError:
+        return False
+    return returncode == 0
+
+
+def compress_one(video_path: Path, output_path: Path, quality: str, encoder: str,
+                 threads: Optional[int] = None, compress=compress_video,
+                 tune: Optional[str] = None,
+                 movflags: str = FASTSTART_MOVFLAGS,
+                 max_height: Optional[int] = None) -> Tuple[Path, int, bool]:
+    """Compress one video to output_path (see assign_output_paths).
+
+    compress is compress_video or compress_video_pyav. Videos that are
+    already efficient H.264 are stream-copied instead of re-encoded, unless
+    they are taller than max_height; low bit rate sources get a higher CRF.
+    The video is written to a .part file next to output_path and renamed
+    over it only once complete, so a failed or interrupted encode never
+    leaves a partial output that a re-run would take as done.
+    Returns (output size in bytes, stream-copied).
+    """
+    part_path = output_path.with_name(output_path.name + '.part')
+    try:
+        info = probe_video(video_path)
+        fits = not max_height or int(info.get('height') or 0) <= max_height
+        copied = fits and can_stream_copy(info, quality) and stream_copy(video_path, part_path, movflags)
+        if not copied:
+            compress(video_path, part_path, quality, encoder, threads, tune, movflags,
+                     crf=adaptive_crf(info, quality), max_height=max_height)
+        os.replace(part_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(part_path)
+        except OSError:
+            pass
+        raise
+    return output_path.stat().st_size, copied
+
+
+def is_up_to_date(video_path: Path, output_path: Path) -> bool:
+    """True if video_path's output from an earlier run exists, isn't empty and is newer."""
+    try:
+        out = output_path.stat()
+        return out.st_size > 0 and out.st_mtime >= video_path.stat().st_mtime
+    except OSError:
+        return False
+
+
+def default_jobs(encoder: str) -> int:
+    """How many FFmpeg processes to run at once for an encoder."""
+    cpus = os.cpu_count() or 1
+    if encoder == SOFTWARE_ENCODER:
+        return max(1, cpus // THREADS_PER_FFMPEG)
+    return MAX_HW_JOBS
+
+
+def is_interactive() -> bool:
+    """True when double-clicked: a frozen EXE on a console, started without flags."""
+    return is_frozen() and len(sys.argv) == 1 and sys.stdin is not None and sys.stdin.isatty()
 
 
 def get_quality_choice() -> str:
     """Get quality choice from user when running interactively."""
-    if is_frozen():
+    if is_interactive():
         print("\nQuality presets:")
         print("  h = High quality (larger files)")
         print("  m = Medium quality (balanced) [default]")
@@ -191,6 +826,39 @@ def get_quality_choice() -> str:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Compress videos with FFmpeg")
+    parser.add_argument('--codec', choices=list(CODEC_CHOICES),
+                        default=os.environ.get('VIDEO_COMPRESSOR_CODEC', 'auto'),
+                        help='Video encoder: auto picks a GPU encoder when available (default: auto, or $VIDEO_COMPRESSOR_CODEC)')
+    parser.add_argument('--gpu', action='store_true',
+                        help='Require a GPU encoder: pick the best one available and stop if there is none')
+    parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                        default=os.environ.get('VIDEO_COMPRESSOR_QUALITY'),
+                        help=f'Quality preset (default: $VIDEO_COMPRESSOR_QUALITY, else ask when double-clicked, else {DEFAULT_QUALITY})')
+    parser.add_argument('--tune', choices=TUNE_CHOICES, default=None,
+                        help='libx264 tuning for the content, e.g. film or animation (default: none)')
+    parser.add_argument('--jobs', '--workers', type=int, default=None,
+                        help=f'Videos compressed at once (default: CPUs/{THREADS_PER_FFMPEG} for libx264, {MAX_HW_JOBS} for GPU encoders)')
+    parser.add_argument('--max-height', type=int, default=None, metavar='PIXELS',
+                        help='Scale videos taller than this down to it, e.g. 1080 (default: keep the resolution)')
+    parser.add_argument('--force', action='store_true',
+                        help='Compress every video again, even those with an up-to-date output from an earlier run')
+    parser.add_argument('--fragmented', action='store_true',
+                        help='Write fragmented MP4 in one pass instead of rewriting each file '
+                             'for fast start (halves output writes; some older players need faststart)')
+    parser.add_argument('--backend', choices=['auto', 'subprocess', 'pyav'], default='auto',
+                        help='Run an ffmpeg process per video or encode in-process with PyAV '
+                             '(default: auto, PyAV when installed and it supports the encoder)')
+    args = parser.parse_args()
+    if args.codec not in CODEC_CHOICES:
+        parser.error(f"unknown codec {args.codec!r} (from VIDEO_COMPRESSOR_CODEC)")
+    if args.quality is not None and args.quality not in QUALITY_PRESETS:
+        parser.error(f"unknown quality {args.quality!r} (from VIDEO_COMPRESSOR_QUALITY)")
+    if args.max_height is not None and (args.max_height < 2 or args.max_height % 2):
+        parser.error("--max-height must be a positive even number")
+    if args.gpu and args.codec == 'x264':
+        parser.error("--gpu cannot be combined with --codec x264")
+    
     base_dir = get_base_dir()
     output_dir = base_dir / "converted_videos"
     output_dir.mkdir(exist_ok=True)
@@ -222,6 +890,13 @@ def main() -> int:
         return 1
     
     print(f"Using FFmpeg: {ffmpeg_path}")
+    encoder = CODEC_CHOICES[args.codec] or detect_hwaccel(ffmpeg_path)
+    if args.gpu and encoder == SOFTWARE_ENCODER:
+        print("ERROR: --gpu was given but no working GPU encoder was found.")
+        if is_frozen():
+            input("Press Enter to close...")
+        return 1
+    print(f"Using encoder: {encoder}")
     
     video_files = list(iter_video_files(base_dir))
     
@@ -231,59 +906,118 @@ def main() -> int:
             input("Press Enter to close...")
         return 0
 
+    print(f"Found {len(video_files)} video file(s).")
+    
+    # Every video keeps the output name it was first given (see sources.json); re-runs skip
+    # videos whose output is already there and newer than them
+    manifest = load_output_manifest(output_dir)
+    output_paths = assign_output_paths([video_path for video_path, _ in video_files],
+                                       output_dir, base_dir, manifest)
+    save_output_manifest(output_dir, manifest)
+    pending = [(video_path, size, output_path)
+                 for (video_path, size), output_path in zip(video_files, output_paths)
+                 if args.force or not is_up_to_date(video_path, output_path)]
+    skipped = len(video_files) - len(pending)
+    video_files = pending
+    if skipped:
+        print(f"Skipping {skipped} already compressed video(s) (--force to redo them).")
+    if not video_files:
+        print("Nothing left to compress.")
+        if is_frozen():
+            input("Press Enter to close...")
+        return 0
     total = len(video_files)
-    print(f"Found {total} video file(s).")
     
     # Get quality preference
-    quality = get_quality_choice()
-    print(f"Using quality preset: {quality} (CRF {QUALITY_PRESETS[quality]})")
+    quality = args.quality or get_quality_choice()
+    if encoder == SOFTWARE_ENCODER:
+        print(f"Using quality preset: {quality} (CRF {QUALITY_PRESETS[quality]})")
+    else:
+        print(f"Using quality preset: {quality}")
+    if args.max_height:
+        print(f"Scaling videos taller than {args.max_height}px down to {args.max_height}px")
     print(f"Output directory: {output_dir}")
     
-    if is_frozen():
+    if is_interactive():
         input("\nPress Enter to start compression...")
 
     compressed = 0
+    stream_copied = 0
     failed = 0
-    total_size_before = 0
-    total_size_after = 0
+    # Why videos failed: FFmpeg's return code, None for everything else
+    failure_causes: Counter = Counter()
+    # Raw byte sizes of finished videos; the summary is worked out after the pool
+    sizes_before: List[int] = []
+    sizes_after: List[int] = []
     
-    for idx, video_path in enumerate(video_files, start=1):
-        try:
-            # Generate output filename
-            output_name = f"{video_path.stem}_compressed.mp4"
-            output_path = output_dir / output_name
-            output_path = unique_path(output_path)
-            
-            size_before = get_file_size_mb(video_path)
-            total_size_before += size_before
-            
-            print(f"\n[{idx}/{total}] Compressing: {video_path.name}")
-            print(f"  Size: {size_before:.1f} MB")
-            print(f"  Output: {output_path.name}")
-            
-            compress_video(video_path, output_path, quality)
+    # Each file is its own FFmpeg process, so threads just wait on them.
+    # With several running, each libx264 gets a few threads instead of all cores.
+    jobs = max(1, args.jobs or default_jobs(encoder))
+    threads = THREADS_PER_FFMPEG if jobs > 1 and encoder == SOFTWARE_ENCODER else None
+    compress = compress_video
+    if args.backend == 'pyav':
+        if _AV is None:
+            print("PyAV is not installed; using the ffmpeg executable instead.")
+        else:
+            compress = compress_video_pyav
+    elif args.backend == 'auto' and pyav_supports(encoder):
+        # One process for every video instead of an ffmpeg start-up per file
+        compress = compress_video_pyav
+    print(f"Backend: {'PyAV (in-process)' if compress is compress_video_pyav else 'ffmpeg process per video'}")
+    movflags = FRAGMENTED_MOVFLAGS if args.fragmented else FASTSTART_MOVFLAGS
+    print(f"\nCompressing with {jobs} parallel job(s)...")
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(compress_one, video_path, output_path, quality, encoder, threads, compress, args.tune, movflags, args.max_height): (video_path, size, output_path)
+                   for video_path, size, output_path in video_files}
+        # Jobs start in submission order: while the first ones encode, read the
+        # start of the one that gets the next free slot, so it doesn't open cold
+        waiting = iter(video_files[jobs:])
+        for video_path, _, _ in islice(waiting, 1):
+            advise_cache(video_path, 'WILLNEED', PREFETCH_BYTES)
+        for idx, future in enumerate(as_completed(futures), start=1):
+            video_path, size_before, output_path = futures[future]
+            for next_path, _, _ in islice(waiting, 1):
+                advise_cache(next_path, 'WILLNEED', PREFETCH_BYTES)
+            # The finished input won't be read again
+            advise_cache(video_path, 'DONTNEED')
+            try:
+                size_after, copied = future.result()
+            except Exception as e:
+                failed += 1
+                failure_causes[e.returncode if isinstance(e, EncodeError) else None] += 1
+                print(f"\n[{idx}/{total}] ✗ {video_path.name}: {e}")
+                continue
             
-            size_after = get_file_size_mb(output_path)
-            total_size_after += size_after
-            compression_ratio = ((size_before - size_after) / size_before) * 100
+            sizes_before.append(size_before)
+            sizes_after.append(size_after)
+            compression_ratio = ((size_before - size_after) / size_before) * 100 if size_before else 0.0
             
-            print(f"  ✓ Done! {size_after:.1f} MB ({compression_ratio:+.1f}%)")
+            # One write per video, so lines from the loop don't interleave
+            print(f"\n[{idx}/{total}] ✓ {video_path.name} -> {output_path.name}{' (stream-copied)' if copied else ''}\n"
+                  f"  {size_before / MB:.1f} MB -> {size_after / MB:.1f} MB ({compression_ratio:+.1f}%)")
             compressed += 1
-            
-        except Exception as e:
-            failed += 1
-            print(f"  ✗ ERROR: {e}")
-
-    print(f"\n{'='*50}")
-    print(f"Compression Summary:")
-    print(f"  Processed: {compressed}")
-    print(f"  Failed: {failed}")
-    print(f"  Total size before: {total_size_before:.1f} MB")
-    print(f"  Total size after: {total_size_after:.1f} MB")
+            stream_copied += copied
+
+    total_size_before = sum(sizes_before)
+    total_size_after = sum(sizes_after)
+    summary = [f"\n{'='*50}", "Compression Summary:", f"  Processed: {compressed}"]
+    if stream_copied:
+        summary.append(f"  Stream-copied (already efficient H.264, not re-encoded): {stream_copied}")
+    if skipped:
+        summary.append(f"  Skipped (already compressed): {skipped}")
+    summary.append(f"  Failed: {failed}")
+    if failure_causes:
+        causes = ", ".join(f"{'other error' if rc is None else f'FFmpeg exit code {rc}'}: {count}"
+                           for rc, count in failure_causes.most_common())
+        summary.append(f"    ({causes})")
+    summary.append(f"  Total size before: {total_size_before / MB:.1f} MB")
+    summary.append(f"  Total size after: {total_size_after / MB:.1f} MB")
     if total_size_before > 0:
         overall_reduction = ((total_size_before - total_size_after) / total_size_before) * 100
-        print(f"  Overall reduction: {overall_reduction:+.1f}%")
-    print(f"  Output directory: {output_dir}")
+        summary.append(f"  Overall reduction: {overall_reduction:+.1f}%")
+    summary.append(f"  Output directory: {output_dir}")
+    print("\n".join(summary))
     
     if is_frozen():
         input("\nPress Enter to close...")